@@ -33,6 +33,9 @@ class Settings:
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     
+    # Resolve core components through registry.json instead of direct imports
+    USE_REGISTRY = os.getenv('USE_REGISTRY', 'false').lower() == 'true'
+    
     # Trading parameters
     TOTAL_CAPITAL = 10000
     MAX_PER_TRADE = 2000
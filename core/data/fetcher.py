@@ -6,7 +6,10 @@ Implements tiered fetching: cache → snapshot → bars.
 import logging
 from typing import Optional, Dict, List, Any
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
+from requests import Session
+from requests.adapters import HTTPAdapter
 
 from alpaca.data import StockHistoricalDataClient, StockLatestDataClient
 from alpaca.data.requests import StockBarsRequest, StockSnapshotRequest, StockLatestTradeRequest
@@ -17,6 +20,14 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Symbols per multi-symbol request (keeps query strings a sane length)
+BULK_REQUEST_SIZE = 200
+
+# Field layout returned by get_bars_ndarray (float64 to match the scan kernel)
+BAR_DTYPE = np.dtype([
+    ('volume', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('open', 'f8')
+])
+
 class DataFetcher:
     """
     Fetches market data from Alpaca with tiered strategy.
@@ -38,11 +49,30 @@ class DataFetcher:
         )
         
         # Get cache from registry
-        registry = ComponentRegistry()
-        self.cache = registry.get('data', 'cache')()
+        registry = ComponentRegistry.get_default()
+        self.cache = registry.instance('data', 'cache')
         
         logger.info("DataFetcher initialized")
     
+    def configure_session(self, pool_connections: int = 16, pool_maxsize: int = 16):
+        """
+        Size the keep-alive connection pools of the Alpaca clients.
+        
+        alpaca-py sends every request through a requests.Session; mounting a
+        larger adapter lets concurrent fetches reuse warm TLS connections
+        instead of opening new ones past the default pool of 10.
+        """
+        for client in (self.historical_client, self.latest_client):
+            session = getattr(client, '_session', None)
+            if not isinstance(session, Session):
+                logger.warning(f"{type(client).__name__} has no requests session, pool not configured")
+                continue
+            
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount('https://', adapter)
+        
+        logger.debug(f"HTTP pools configured: {pool_connections} hosts x {pool_maxsize} connections")
+    
     def get_current_price(self, ticker: str, max_cache_age: int = 60) -> Optional[Dict[str, Any]]:
         """
         Get current price using tiered approach.
@@ -87,6 +117,68 @@ class DataFetcher:
         logger.error(f"All price sources failed for {ticker}")
         return None
     
+    def get_current_prices(self, tickers: List[str], max_cache_age: int = 60) -> Dict[str, Dict[str, Any]]:
+        """
+        Get current prices for many symbols, same tiers as get_current_price.
+        
+        Cache misses are fetched with one multi-symbol snapshot request per
+        BULK_REQUEST_SIZE symbols instead of one request per symbol.
+        
+        Returns:
+            Dict of ticker -> price data; symbols with no price are omitted
+        """
+        result = {}
+        missing = []
+        for ticker in tickers:
+            cached = self.cache.get(ticker, max_age_seconds=max_cache_age)
+            if cached:
+                result[ticker] = cached
+            else:
+                missing.append(ticker)
+        
+        if result:
+            logger.debug(f"Cache hits for {len(result)}/{len(tickers)} symbols")
+        
+        for i in range(0, len(missing), BULK_REQUEST_SIZE):
+            chunk = missing[i:i + BULK_REQUEST_SIZE]
+            try:
+                request = StockSnapshotRequest(symbol_or_symbols=chunk)
+                snapshots = self.latest_client.get_stock_snapshot(request)
+            except Exception as e:
+                logger.warning(f"Bulk snapshot failed for {len(chunk)} symbols: {e}")
+                continue
+            
+            for ticker in chunk:
+                s = snapshots.get(ticker)
+                snapshot = self._snapshot_to_dict(s) if s else None
+                if snapshot and snapshot['price'] is not None:
+                    self.cache.update(ticker, snapshot['price'],
+                                      volume=snapshot.get('volume', 0),
+                                      bid=snapshot.get('bid'),
+                                      ask=snapshot.get('ask'),
+                                      source='snapshot')
+                    result[ticker] = snapshot
+        
+        # Anything the snapshots missed goes through the per-symbol fallbacks
+        for ticker in missing:
+            if ticker not in result:
+                price_data = self.get_current_price(ticker, max_cache_age)
+                if price_data:
+                    result[ticker] = price_data
+        
+        return result
+    
+    @staticmethod
+    def _snapshot_to_dict(s) -> Dict[str, Any]:
+        return {
+            'price': float(s.latest_trade.price) if s.latest_trade else None,
+            'bid': float(s.latest_ask.price) if s.latest_ask else None,
+            'ask': float(s.latest_bid.price) if s.latest_bid else None,
+            'volume': float(s.latest_trade.size) if s.latest_trade else 0,
+            'source': 'snapshot',
+            'timestamp': datetime.utcnow()
+        }
+    
     def _fetch_snapshot(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Fetch snapshot from Alpaca."""
         try:
@@ -94,15 +186,7 @@ class DataFetcher:
             snapshot = self.latest_client.get_stock_snapshot(request)
             
             if ticker in snapshot:
-                s = snapshot[ticker]
-                return {
-                    'price': float(s.latest_trade.price) if s.latest_trade else None,
-                    'bid': float(s.latest_ask.price) if s.latest_ask else None,
-                    'ask': float(s.latest_bid.price) if s.latest_bid else None,
-                    'volume': float(s.latest_trade.size) if s.latest_trade else 0,
-                    'source': 'snapshot',
-                    'timestamp': datetime.utcnow()
-                }
+                return self._snapshot_to_dict(snapshot[ticker])
         except Exception as e:
             logger.debug(f"Snapshot error for {ticker}: {e}")
         return None
@@ -125,6 +209,20 @@ class DataFetcher:
             logger.debug(f"Last trade error for {ticker}: {e}")
         return None
     
+    def _bars_request(self, symbol_or_symbols, period: int, timeframe: TimeFrame,
+                      timeframe_minutes: int) -> StockBarsRequest:
+        # Calculate start time
+        end = datetime.utcnow()
+        start = end - timedelta(days=period * timeframe_minutes * 2)  # Buffer
+        
+        return StockBarsRequest(
+            symbol_or_symbols=symbol_or_symbols,
+            timeframe=timeframe,
+            start=start,
+            end=end,
+            feed=settings.ALPACA_FEED  # 'iex' for free tier
+        )
+    
     def get_bars(self, ticker: str, period: int = 20, 
                  timeframe: TimeFrame = TimeFrame.Minute,
                  timeframe_minutes: int = 5) -> Optional[pd.DataFrame]:
@@ -134,18 +232,7 @@ class DataFetcher:
         This is Stage B/C validation - heavier API call.
         """
         try:
-            # Calculate start time
-            end = datetime.utcnow()
-            start = end - timedelta(days=period * timeframe_minutes * 2)  # Buffer
-            
-            request = StockBarsRequest(
-                symbol_or_symbols=ticker,
-                timeframe=timeframe,
-                start=start,
-                end=end,
-                feed=settings.ALPACA_FEED  # 'iex' for free tier
-            )
-            
+            request = self._bars_request(ticker, period, timeframe, timeframe_minutes)
             bars = self.historical_client.get_stock_bars(request)
             
             if ticker in bars.data:
@@ -158,11 +245,60 @@ class DataFetcher:
         
         return None
     
-    def get_bars_batch(self, tickers: List[str], period: int = 20) -> Dict[str, pd.DataFrame]:
-        """Fetch bars for multiple symbols (use sparingly)."""
+    def get_bars_ndarray(self, ticker: str, period: int = 20,
+                         timeframe: TimeFrame = TimeFrame.Minute,
+                         timeframe_minutes: int = 5) -> Optional[np.ndarray]:
+        """
+        Fetch historical bars as a structured array of BAR_DTYPE.
+        
+        Same request as get_bars, but skips building a DataFrame; use it
+        where only the OHLCV columns are needed (e.g. the watch list scan).
+        """
+        try:
+            request = self._bars_request(ticker, period, timeframe, timeframe_minutes)
+            bars = self.historical_client.get_stock_bars(request)
+            
+            if ticker in bars.data:
+                bar_list = bars.data[ticker]
+                rec = np.fromiter(
+                    ((b.volume, b.high, b.low, b.close, b.open) for b in bar_list),
+                    dtype=BAR_DTYPE, count=len(bar_list)
+                )
+                logger.debug(f"Fetched {len(rec)} bars for {ticker}")
+                return rec
+            
+        except Exception as e:
+            logger.error(f"Bar fetch failed for {ticker}: {e}")
+        
+        return None
+    
+    def get_bars_batch(self, tickers: List[str], period: int = 20,
+                       timeframe: TimeFrame = TimeFrame.Minute,
+                       timeframe_minutes: int = 5) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch bars for multiple symbols in multi-symbol requests.
+        
+        Same window as get_bars; symbols with no bars are omitted.
+        """
         result = {}
-        for ticker in tickers:
-            df = self.get_bars(ticker, period)
-            if df is not None:
-                result[ticker] = df
+        for i in range(0, len(tickers), BULK_REQUEST_SIZE):
+            chunk = tickers[i:i + BULK_REQUEST_SIZE]
+            try:
+                request = self._bars_request(chunk, period, timeframe, timeframe_minutes)
+                bars = self.historical_client.get_stock_bars(request)
+                # One frame for the whole chunk, indexed by (symbol, timestamp)
+                frame = bars.df
+            except Exception as e:
+                logger.error(f"Bulk bar fetch failed for {len(chunk)} symbols: {e}")
+                continue
+            
+            for ticker in chunk:
+                if ticker not in bars.data:
+                    continue
+                try:
+                    result[ticker] = frame.xs(ticker, level='symbol')
+                except Exception as e:
+                    logger.error(f"Bar conversion failed for {ticker}: {e}")
+        
+        logger.debug(f"Fetched bars for {len(result)}/{len(tickers)} symbols")
         return result
\ No newline at end of file
@@ -4,15 +4,23 @@ Handles trading hours, holidays, early closes.
 """
 
 import logging
-from datetime import datetime, date, time, timedelta
+from datetime import datetime, date, time, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List
-import pytz
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
 # Timezone definitions
-NY_TZ = pytz.timezone('America/New_York')
-UTC_TZ = pytz.UTC
+NY_TZ = ZoneInfo('America/New_York')
+UTC_TZ = timezone.utc
+
+@lru_cache(maxsize=1024)
+def _session_bounds(date_ny: date, close_time: time) -> Tuple[datetime, datetime]:
+    """(open_utc, close_utc) for a NY trading date; fixed per date, so computed once."""
+    open_ny = datetime.combine(date_ny, time(9, 30), tzinfo=NY_TZ)
+    close_ny = datetime.combine(date_ny, close_time, tzinfo=NY_TZ)
+    return open_ny.astimezone(UTC_TZ), close_ny.astimezone(UTC_TZ)
 
 class MarketSession:
     """
@@ -34,21 +42,25 @@ class MarketSession:
         """
         self.calendar = calendar or {}
         self.early_close_time = self.calendar.get('early_close_time', time(13, 0))
+        
+        # Sets for O(1) lookups; calendars may span several years
+        self._holiday_dates = frozenset(self.calendar.get('holiday_dates', ()))
+        self._early_close_dates = frozenset(self.calendar.get('early_close_dates', ()))
     
     def is_trading_day(self, dt_utc: Optional[datetime] = None) -> bool:
         """Check if given day is a trading day."""
         if dt_utc is None:
             dt_utc = datetime.now(UTC_TZ)
         
-        dt_ny = dt_utc.astimezone(NY_TZ)
-        date_ny = dt_ny.date()
-        
+        return self._is_trading_date(dt_utc.astimezone(NY_TZ).date())
+    
+    def _is_trading_date(self, date_ny: date) -> bool:
         # Weekend check
-        if dt_ny.weekday() >= 5:
+        if date_ny.weekday() >= 5:
             return False
         
         # Holiday check
-        if date_ny in self.calendar.get('holiday_dates', []):
+        if date_ny in self._holiday_dates:
             return False
         
         return True
@@ -58,26 +70,11 @@ class MarketSession:
         if dt_utc is None:
             dt_utc = datetime.now(UTC_TZ)
         
-        if not self.is_trading_day(dt_utc):
+        open_utc, close_utc = self.get_session_bounds(dt_utc)
+        if open_utc is None:
             return False
         
-        dt_ny = dt_utc.astimezone(NY_TZ)
-        date_ny = dt_ny.date()
-        
-        # Check if early close
-        if date_ny in self.calendar.get('early_close_dates', []):
-            close_time = datetime.combine(date_ny, self.early_close_time)
-            close_time = NY_TZ.localize(close_time)
-            return dt_ny <= close_time
-        
-        # Regular hours
-        open_time = datetime.combine(date_ny, time(9, 30))
-        close_time = datetime.combine(date_ny, time(16, 0))
-        
-        open_time = NY_TZ.localize(open_time)
-        close_time = NY_TZ.localize(close_time)
-        
-        return open_time <= dt_ny <= close_time
+        return open_utc <= dt_utc <= close_utc
     
     def get_session_bounds(self, dt_utc: Optional[datetime] = None) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
@@ -89,25 +86,14 @@ class MarketSession:
         if dt_utc is None:
             dt_utc = datetime.now(UTC_TZ)
         
-        if not self.is_trading_day(dt_utc):
+        date_ny = dt_utc.astimezone(NY_TZ).date()
+        if not self._is_trading_date(date_ny):
             return None, None
         
-        dt_ny = dt_utc.astimezone(NY_TZ)
-        date_ny = dt_ny.date()
-        
         # Check if early close
-        if date_ny in self.calendar.get('early_close_dates', []):
-            open_ny = datetime.combine(date_ny, time(9, 30))
-            close_ny = datetime.combine(date_ny, self.early_close_time)
-        else:
-            open_ny = datetime.combine(date_ny, time(9, 30))
-            close_ny = datetime.combine(date_ny, time(16, 0))
-        
-        # Localize and convert to UTC
-        open_ny = NY_TZ.localize(open_ny)
-        close_ny = NY_TZ.localize(close_ny)
-        
-        return open_ny.astimezone(UTC_TZ), close_ny.astimezone(UTC_TZ)
+        if date_ny in self._early_close_dates:
+            return _session_bounds(date_ny, self.early_close_time)
+        return _session_bounds(date_ny, time(16, 0))
     
     def expected_bars_between(self, start_utc: datetime, end_utc: datetime, 
                               bar_minutes: int = 5) -> int:
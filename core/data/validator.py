@@ -22,9 +22,9 @@ class DataValidator:
     """
     
     def __init__(self):
-        registry = ComponentRegistry()
-        self.cache = registry.get('data', 'cache')()
-        self.session = registry.get('data', 'session')()
+        registry = ComponentRegistry.get_default()
+        self.cache = registry.instance('data', 'cache')
+        self.session = registry.instance('data', 'session')
     
     def stage_a_validate(self, ticker: str, 
                          price_data: Optional[Dict] = None) -> Tuple[bool, str, Dict]:
@@ -39,8 +39,8 @@ class Executor:
         )
         
         # Get dependencies
-        registry = ComponentRegistry()
-        self.slippage = registry.get('execution', 'slippage')()
+        registry = ComponentRegistry.get_default()
+        self.slippage = registry.instance('execution', 'slippage')
         
         # Track pending orders
         self.pending_orders = {}
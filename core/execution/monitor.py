@@ -7,7 +7,7 @@ import logging
 import threading
 import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Callable
 import sqlite3
 from pathlib import Path
 
@@ -31,9 +31,9 @@ class ExitMonitor:
         self.db_path = Path(db_path)
         
         # Get dependencies
-        registry = ComponentRegistry()
-        self.executor = registry.get('execution', 'executor')()
-        self.session = registry.get('data', 'session')()
+        registry = ComponentRegistry.get_default()
+        self.executor = registry.instance('execution', 'executor')
+        self.session = registry.instance('data', 'session')
         
         # Exit thresholds
         self.pre_close_warning_minutes = 15
@@ -44,13 +44,45 @@ class ExitMonitor:
     def _get_connection(self):
         return sqlite3.connect(str(self.db_path))
     
+    def check_all_exits(self) -> Dict[str, List[Dict]]:
+        """
+        Run the stop loss, strategy and pre-close checks off one positions query.
+        
+        Returns:
+            {'stop_loss': [...], 'strategy': [...], 'forced': [...]}
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT ticket_id, ticker, entry_price, quantity, stop_loss, strategy,
+                   status, exit_signal
+            FROM positions
+            WHERE status IN ('OPEN', 'CLOSING')
+        """)
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        open_positions = [row[:6] for row in rows if row[6] == 'OPEN']
+        closing = [(row[0], row[1], row[3], row[7]) for row in rows if row[6] == 'CLOSING']
+        
+        stop_losses = self._exit_stop_losses(open_positions)
+        strategy_exits = self._exit_strategy(closing)
+        
+        # Positions just stopped out are gone; don't force-close them again
+        closed = {exit['ticket_id'] for exit in stop_losses}
+        forced = self._exit_pre_close(
+            lambda: [(p[0], p[1], p[3]) for p in open_positions if p[0] not in closed]
+        )
+        
+        return {'stop_loss': stop_losses, 'strategy': strategy_exits, 'forced': forced}
+    
     def check_stop_losses(self) -> List[Dict]:
         """
         Check all open positions for stop loss hits.
         Uses current price (real-time check).
         """
-        triggered = []
-        
         conn = self._get_connection()
         cursor = conn.cursor()
         
@@ -64,6 +96,11 @@ class ExitMonitor:
         positions = cursor.fetchall()
         conn.close()
         
+        return self._exit_stop_losses(positions)
+    
+    def _exit_stop_losses(self, positions: List[Tuple]) -> List[Dict]:
+        triggered = []
+        
         for pos in positions:
             ticket_id, ticker, entry_price, quantity, stop_loss, strategy = pos
             
@@ -116,8 +153,6 @@ class ExitMonitor:
         # Actual strategy logic lives in strategy files
         # Here we just execute exits that strategies have signaled
         
-        triggered = []
-        
         conn = self._get_connection()
         cursor = conn.cursor()
         
@@ -129,6 +164,12 @@ class ExitMonitor:
         """)
         
         closing = cursor.fetchall()
+        conn.close()
+        
+        return self._exit_strategy(closing)
+    
+    def _exit_strategy(self, closing: List[Tuple]) -> List[Dict]:
+        triggered = []
         
         for pos in closing:
             ticket_id, ticker, quantity, exit_signal = pos
@@ -157,13 +198,30 @@ class ExitMonitor:
             elif exit_result['status'] == 'PENDING':
                 logger.info(f"Exit order pending for {ticker}")
         
-        conn.close()
         return triggered
     
     def check_pre_close(self) -> List[Dict]:
         """
         Check if we're near market close and force exits if needed.
         """
+        return self._exit_pre_close(self._load_open_for_close)
+    
+    def _load_open_for_close(self) -> List[Tuple]:
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT ticket_id, ticker, quantity
+            FROM positions
+            WHERE status = 'OPEN'
+        """)
+        
+        positions = cursor.fetchall()
+        conn.close()
+        return positions
+    
+    def _exit_pre_close(self, load_positions: Callable[[], List[Tuple]]) -> List[Dict]:
+        """Force exits near the close; positions are only loaded if needed."""
         now = datetime.utcnow()
         mins_to_close = minutes_until_market_close(now, self.session.calendar)
         
@@ -177,19 +235,7 @@ class ExitMonitor:
             # FORCE EXIT: market sell all positions
             logger.warning(f"FORCE CLOSE: {mins_to_close:.1f} minutes to close")
             
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT ticket_id, ticker, quantity
-                FROM positions
-                WHERE status = 'OPEN'
-            """)
-            
-            positions = cursor.fetchall()
-            conn.close()
-            
-            for pos in positions:
+            for pos in load_positions():
                 ticket_id, ticker, quantity = pos
                 
                 exit_result = self.executor.execute_exit(
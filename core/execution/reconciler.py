@@ -28,13 +28,17 @@ class Reconciler:
         self.db_path = Path(db_path)
         
         # Get dependencies
-        registry = ComponentRegistry()
-        self.executor = registry.get('execution', 'executor')()
+        registry = ComponentRegistry.get_default()
+        self.executor = registry.instance('execution', 'executor')
         
         # Tolerance thresholds
         self.price_tolerance_pct = 2.0  # 2% price difference allowed
         self.quantity_tolerance = 0      # Must match exactly
         
+        # Last clean result, reused while neither side's positions change
+        self._last_signature: Optional[int] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        
         logger.info("Reconciler initialized")
     
     def _get_connection(self):
@@ -53,6 +57,12 @@ class Reconciler:
         local_positions = self._get_local_positions()
         alpaca_positions = self._get_alpaca_positions()
         
+        # Nothing changed since a clean run: skip the diff, auto-reconcile and log write
+        signature = self._positions_signature(local_positions, alpaca_positions)
+        if signature == self._last_signature:
+            logger.info("Positions unchanged since last reconciliation (OK)")
+            return self._last_result
+        
         results = {
             'matched': [],
             'mismatch_price': [],
@@ -115,11 +125,28 @@ class Reconciler:
         # Log results
         self._log_reconciliation(results, status, message)
         
-        return {
+        result = {
             'status': status,
             'message': message,
             'results': results
         }
+        
+        # Only a clean result is safe to reuse; anything else re-runs next cycle
+        if status == 'OK':
+            self._last_signature, self._last_result = signature, result
+        else:
+            self._last_signature, self._last_result = None, None
+        
+        return result
+    
+    @staticmethod
+    def _positions_signature(local_positions: List[Dict], alpaca_positions: Dict[str, Dict]) -> int:
+        """Hash of the fields reconciliation compares, on both sides."""
+        local = sorted((p['ticket_id'], p['ticker'], p['quantity'], p['entry_price'])
+                       for p in local_positions)
+        alpaca = sorted((ticker, p['quantity'], p['avg_entry_price'])
+                        for ticker, p in alpaca_positions.items())
+        return hash((tuple(local), tuple(alpaca)))
     
     def _get_local_positions(self) -> List[Dict]:
         """Get all open positions from local database."""
@@ -27,8 +27,8 @@ class BreadthCalculator:
     
     def __init__(self):
         # Get dependencies
-        registry = ComponentRegistry()
-        self.fetcher = registry.get('data', 'fetcher')()
+        registry = ComponentRegistry.get_default()
+        self.fetcher = registry.instance('data', 'fetcher')
         
         # Benchmark symbols by sector
         self.sectors = {
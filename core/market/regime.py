@@ -30,8 +30,8 @@ class RegimeDetector:
         self.db_path = Path(db_path)
         
         # Get dependencies
-        registry = ComponentRegistry()
-        self.fetcher = registry.get('data', 'fetcher')()
+        registry = ComponentRegistry.get_default()
+        self.fetcher = registry.instance('data', 'fetcher')
         
         # Benchmark symbols (stable, not rotating)
         self.benchmarks = ['SPY', 'QQQ', 'IWM', 'XLF', 'XLK', 'XLE', 'TLT']
@@ -32,9 +32,9 @@ class Sentinel:
         self.db_path = Path(db_path)
         
         # Get dependencies
-        registry = ComponentRegistry()
-        self.regime = registry.get('market', 'regime')()
-        self.reconciler = registry.get('execution', 'reconciler')()
+        registry = ComponentRegistry.get_default()
+        self.regime = registry.instance('market', 'regime')
+        self.reconciler = registry.instance('execution', 'reconciler')
         
         # Health thresholds
         self.max_api_calls_per_min = 180
@@ -278,14 +278,19 @@ class Sentinel:
         self.kill_reason = ""
         logger.info("Kill switch released")
     
-    def should_trade(self) -> tuple:
+    def should_trade(self, health: Optional[Dict[str, Any]] = None) -> tuple:
         """
         Determine if trading should proceed.
         
+        Args:
+            health: Result of check_health() already taken this cycle
+                    (checked here if not given)
+        
         Returns:
             (should_trade, reason)
         """
-        health = self.check_health()
+        if health is None:
+            health = self.check_health()
         
         # Never trade if kill switch engaged
         if self.kill_switch_engaged:
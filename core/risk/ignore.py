@@ -7,10 +7,26 @@ import sqlite3
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, FrozenSet
 
 logger = logging.getLogger(__name__)
 
+# Same layout as ignore_list; created on demand for databases built before it existed
+_HISTORY_DDL = """
+    CREATE TABLE IF NOT EXISTS ignore_history (
+        ticker TEXT,
+        reason_code TEXT,
+        scope TEXT,
+        ttl_utc DATETIME,
+        auto_manual TEXT,
+        retry_count INTEGER DEFAULT 0,
+        backoff_level INTEGER DEFAULT 1,
+        last_seen_issue TEXT,
+        first_seen DATETIME,
+        notes TEXT
+    )
+"""
+
 class IgnoreManager:
     """
     Manages symbol ignore list with exponential backoff.
@@ -142,11 +158,51 @@ class IgnoreManager:
             for r in rows
         ]
     
-    def cleanup_expired(self) -> int:
-        """Remove expired ignores (but keep history for backoff)."""
-        # We don't actually delete - we keep for backoff tracking
-        # But we could archive very old ones
-        return 0
+    def cleanup_expired(self, archive_after_days: int = 30) -> int:
+        """
+        Archive ignores that expired more than archive_after_days ago.
+        
+        Recently expired rows stay in ignore_list for backoff tracking;
+        older ones move to ignore_history to keep the hot table small.
+        
+        Returns:
+            Number of rows archived
+        """
+        cutoff = f"-{int(archive_after_days)} days"
+        
+        conn = self._get_connection()
+        with conn:
+            conn.execute(_HISTORY_DDL)
+            conn.execute("""
+                INSERT INTO ignore_history
+                SELECT * FROM ignore_list
+                WHERE ttl_utc < datetime('now', ?)
+            """, (cutoff,))
+            cursor = conn.execute("""
+                DELETE FROM ignore_list
+                WHERE ttl_utc < datetime('now', ?)
+            """, (cutoff,))
+            archived = cursor.rowcount
+        conn.close()
+        
+        if archived:
+            logger.info(f"Archived {archived} expired ignores to ignore_history")
+        return archived
+    
+    def snapshot(self) -> FrozenSet[str]:
+        """Tickers currently ignored, for filtering many symbols with one query."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT ticker FROM ignore_list
+            WHERE ttl_utc > datetime('now')
+        """)
+        
+        tickers = frozenset(row[0] for row in cursor.fetchall())
+        conn.close()
+        
+        return tickers
     
     def get_backoff_level(self, ticker: str) -> int:
         """Get current backoff level for symbol."""
@@ -175,4 +231,24 @@ class IgnoreManager:
         
         if deleted:
             logger.info(f"Reset ignore for {ticker}")
-        return deleted > 0
\ No newline at end of file
+        return deleted > 0
+    
+    def reset_many(self, tickers: List[str]) -> int:
+        """Manually reset ignores for several symbols in one transaction."""
+        if not tickers:
+            return 0
+        
+        placeholders = ",".join("?" * len(tickers))
+        
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.execute(
+                f"DELETE FROM ignore_list WHERE ticker IN ({placeholders})",
+                list(tickers)
+            )
+            deleted = cursor.rowcount
+        conn.close()
+        
+        if deleted:
+            logger.info(f"Reset ignore for {deleted} symbols")
+        return deleted
\ No newline at end of file
@@ -46,27 +46,19 @@ class LimitsManager:
         conn = self._get_connection()
         cursor = conn.cursor()
         
-        # Realized P&L from today's exits
+        # Realized P&L from today's exits and unrealized P&L from open
+        # positions in a single round trip
         cursor.execute("""
-            SELECT COALESCE(SUM(entry_price * quantity), 0),
-                   COALESCE(SUM(exit_price * quantity), 0)
-            FROM trade_history
-            WHERE exit_time >= ?
+            SELECT
+                COALESCE((SELECT SUM((exit_price - entry_price) * quantity)
+                          FROM trade_history
+                          WHERE exit_time >= ?), 0),
+                COALESCE((SELECT SUM((current_price - entry_price) * quantity)
+                          FROM positions
+                          WHERE status IN ('OPEN', 'CLOSING')), 0)
         """, (midnight,))
         
-        entry_sum, exit_sum = cursor.fetchone()
-        realized = exit_sum - entry_sum
-        
-        # Unrealized P&L from open positions
-        cursor.execute("""
-            SELECT COALESCE(SUM(entry_price * quantity), 0),
-                   COALESCE(SUM(current_price * quantity), 0)
-            FROM positions
-            WHERE status IN ('OPEN', 'CLOSING')
-        """)
-        
-        open_entry, open_current = cursor.fetchone()
-        unrealized = open_current - open_entry
+        realized, unrealized = cursor.fetchone()
         
         conn.close()
         
@@ -7,6 +7,9 @@ import logging
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
+from core.risk.ignore import IgnoreManager
+from core.risk.limits import LimitsManager
+from core.risk.sizer import PositionSizer
 from core.utils.registry import ComponentRegistry
 from config.settings import settings
 
@@ -24,10 +27,20 @@ class RiskManager:
     """
     
     def __init__(self):
-        registry = ComponentRegistry()
-        self.ignore = registry.get('risk', 'ignore')()
-        self.limits = registry.get('risk', 'limits')()
-        self.sizer = registry.get('risk', 'sizer')(
+        if settings.USE_REGISTRY:
+            # Plugin indirection for swapped-in risk components
+            registry = ComponentRegistry.get_default()
+            ignore_cls = registry.get('risk', 'ignore')
+            limits_cls = registry.get('risk', 'limits')
+            sizer_cls = registry.get('risk', 'sizer')
+        else:
+            ignore_cls = IgnoreManager
+            limits_cls = LimitsManager
+            sizer_cls = PositionSizer
+        
+        self.ignore = ignore_cls()
+        self.limits = limits_cls()
+        self.sizer = sizer_cls(
             total_capital=settings.TOTAL_CAPITAL,
             max_per_trade=settings.MAX_PER_TRADE
         )
@@ -5,7 +5,7 @@ Calculates safe position sizes based on capital and risk.
 
 import logging
 import math
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,15 @@ class ConfidenceScorer:
     - Market regime alignment
     """
     
+    # Matrix of strategy x regime compatibility, flattened row-major:
+    # rows are rsi, momentum, hybrid; columns follow _REGIME_CODE
+    _REGIME_CODE = {'BULL': 0, 'NEUTRAL': 1, 'BEAR': 2, 'CRASH': 3}
+    _REGIME_COMPAT = (
+        90, 80, 60, 0,    # rsi
+        100, 70, 30, 0,   # momentum
+        80, 90, 70, 0,    # hybrid
+    )
+    
     def __init__(self):
         # Weights for different factors (sum to 1.0)
         self.weights = {
@@ -193,36 +202,18 @@ class ConfidenceScorer:
     
     def _score_market_regime(self, strategy: str, regime: str) -> float:
         """Score based on market regime alignment."""
-        # Matrix of strategy x regime compatibility
-        compatibility = {
-            'rsi': {
-                'BULL': 90,
-                'NEUTRAL': 80,
-                'BEAR': 60,
-                'CRASH': 0
-            },
-            'momentum': {
-                'BULL': 100,
-                'NEUTRAL': 70,
-                'BEAR': 30,
-                'CRASH': 0
-            },
-            'hybrid': {
-                'BULL': 80,
-                'NEUTRAL': 90,
-                'BEAR': 70,
-                'CRASH': 0
-            }
-        }
+        regime_code = self._REGIME_CODE.get(regime)
+        if regime_code is None:
+            return 50
         
-        # Find which strategy key to use
-        strategy_key = 'rsi'
+        # Find which strategy row to use
+        strategy_code = 0  # rsi
         if 'momentum' in strategy.lower():
-            strategy_key = 'momentum'
+            strategy_code = 1
         elif 'hybrid' in strategy.lower():
-            strategy_key = 'hybrid'
+            strategy_code = 2
         
-        return compatibility.get(strategy_key, {}).get(regime, 50)
+        return self._REGIME_COMPAT[strategy_code * 4 + regime_code]
     
     def rank_signals(self, signals: List[Dict], max_signals: int = 3) -> List[Dict]:
         """
@@ -5,9 +5,13 @@ Prevents re-entering same symbol too quickly after exit.
 
 import sqlite3
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+from core.utils.clock import utcnow_cached
+from core.utils.sqlite_pool import get_reader, run_write
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +21,77 @@ class CooldownManager:
     
     After a stop loss, symbol enters cooldown for that strategy.
     After a take profit, shorter cooldown or none.
+    
+    Each symbol+strategy pair keeps its cooldown on one dedicated
+    'COOLDOWN' row (signal_id cooldown_<ticker>_<strategy>), upserted
+    in a single statement.
+    """
+    
+    _UPSERT_COOLDOWN_SQL = """
+        INSERT INTO signals
+        (signal_id, ticker, strategy, trigger_time, status, cooldown_until)
+        VALUES (?, ?, ?, ?, 'COOLDOWN', ?)
+        ON CONFLICT(signal_id) DO UPDATE SET
+            trigger_time = excluded.trigger_time,
+            cooldown_until = excluded.cooldown_until
     """
     
     def __init__(self, db_path: str = "data/trade_log.db",
                  default_cooldown_minutes: int = 60):
         self.db_path = Path(db_path)
         self.default_cooldown = timedelta(minutes=default_cooldown_minutes)
+        
+        # In-process snapshot of active cooldowns, refreshed every few seconds
+        self.cache_ttl_seconds = 5
+        self._cache: Dict[Tuple[str, str], datetime] = {}
+        self._cache_loaded_at: Optional[float] = None
     
     def _get_connection(self):
-        return sqlite3.connect(str(self.db_path))
+        """Read-only connection; writes go through _write."""
+        return get_reader(self.db_path)
+    
+    def _write(self, fn):
+        """Run fn(conn) in one transaction on the database's writer thread."""
+        return run_write(self.db_path, fn)
+    
+    def _invalidate_cache(self):
+        self._cache_loaded_at = None
+    
+    def _refresh_cache(self):
+        """Reload active cooldowns if the snapshot is older than the TTL."""
+        now = time.monotonic()
+        if (self._cache_loaded_at is not None
+                and now - self._cache_loaded_at < self.cache_ttl_seconds):
+            return
+        
+        conn = self._get_connection()
+        rows = conn.execute("""
+            SELECT ticker, strategy, MAX(cooldown_until)
+            FROM signals
+            WHERE cooldown_until > datetime('now')
+            GROUP BY ticker, strategy
+        """).fetchall()
+        
+        cache = {}
+        for ticker, strategy, cooldown_until in rows:
+            if isinstance(cooldown_until, str):
+                cooldown_until = datetime.fromisoformat(cooldown_until)
+            cache[(ticker, strategy)] = cooldown_until
+        
+        self._cache = cache
+        self._cache_loaded_at = now
+    
+    def _cooldown_duration(self, reason: str, minutes: Optional[int]) -> timedelta:
+        """Cooldown length for a trigger reason (custom minutes win)."""
+        if minutes:
+            return timedelta(minutes=minutes)
+        
+        # Different cooldowns based on reason
+        if reason == "TAKE_PROFIT":
+            return timedelta(minutes=30)  # Shorter after win
+        if reason == "REJECTED":
+            return timedelta(minutes=15)  # Very short after rejection
+        return self.default_cooldown
     
     def set_cooldown(self, ticker: str, strategy: str, 
                      reason: str = "STOP_LOSS",
@@ -39,49 +105,49 @@ class CooldownManager:
             reason: Why cooldown is triggered
             minutes: Custom cooldown duration (uses default if None)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         # Calculate cooldown end time
-        if minutes:
-            duration = timedelta(minutes=minutes)
-        else:
-            # Different cooldowns based on reason
-            if reason == "STOP_LOSS":
-                duration = self.default_cooldown
-            elif reason == "TAKE_PROFIT":
-                duration = timedelta(minutes=30)  # Shorter after win
-            elif reason == "REJECTED":
-                duration = timedelta(minutes=15)  # Very short after rejection
-            else:
-                duration = self.default_cooldown
-        
-        cooldown_until = datetime.utcnow() + duration
-        
-        # Signal_ID format: ticker_strategy_YYYYMMDDHH
-        signal_id = f"{ticker}_{strategy}_{datetime.utcnow().strftime('%Y%m%d%H')}"
-        
-        cursor.execute("""
-            UPDATE signals
-            SET cooldown_until = ?
-            WHERE signal_id = ? OR (ticker = ? AND strategy = ?)
-        """, (cooldown_until, signal_id, ticker, strategy))
-        
-        # Also insert a record if none exists
-        if cursor.rowcount == 0:
-            cursor.execute("""
-                INSERT INTO signals
-                (signal_id, ticker, strategy, trigger_time, status, cooldown_until)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (f"cooldown_{ticker}_{strategy}_{datetime.utcnow().timestamp()}",
-                  ticker, strategy, datetime.utcnow(), "COOLDOWN", cooldown_until))
-        
-        conn.commit()
-        conn.close()
+        now = utcnow_cached()
+        cooldown_until = now + self._cooldown_duration(reason, minutes)
+        
+        self._write(lambda conn: conn.execute(self._UPSERT_COOLDOWN_SQL, (
+            f"cooldown_{ticker}_{strategy}", ticker, strategy, now, cooldown_until
+        )))
+        self._invalidate_cache()
         
         logger.info(f"Cooldown set for {ticker}/{strategy} until {cooldown_until} ({reason})")
         return True
     
+    def set_cooldown_bulk(self, entries: List[Tuple[str, str, str, Optional[int]]]) -> int:
+        """
+        Set many cooldowns in a single write transaction.
+        
+        Args:
+            entries: (ticker, strategy, reason, minutes) tuples; minutes
+                may be None to use the reason's default duration
+        
+        Returns:
+            Number of entries applied
+        """
+        if not entries:
+            return 0
+        
+        now = utcnow_cached()
+        rows = [
+            (f"cooldown_{ticker}_{strategy}", ticker, strategy, now,
+             now + self._cooldown_duration(reason, minutes))
+            for ticker, strategy, reason, minutes in entries
+        ]
+        
+        def upsert(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(self._UPSERT_COOLDOWN_SQL, rows)
+        
+        self._write(upsert)
+        self._invalidate_cache()
+        
+        logger.info(f"Cooldown set for {len(entries)} symbol/strategy pairs")
+        return len(entries)
+    
     def is_on_cooldown(self, ticker: str, strategy: str) -> Tuple[bool, Optional[datetime]]:
         """
         Check if symbol+strategy is on cooldown.
@@ -89,67 +155,34 @@ class CooldownManager:
         Returns:
             (is_on_cooldown, cooldown_until)
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT cooldown_until FROM signals
-            WHERE ticker = ? AND strategy = ?
-              AND cooldown_until > datetime('now')
-            ORDER BY cooldown_until DESC
-            LIMIT 1
-        """, (ticker, strategy))
-        
-        row = cursor.fetchone()
-        conn.close()
+        self._refresh_cache()
         
-        if row:
-            cooldown_until = row[0]
-            if isinstance(cooldown_until, str):
-                cooldown_until = datetime.fromisoformat(cooldown_until)
+        cooldown_until = self._cache.get((ticker, strategy))
+        if cooldown_until and cooldown_until > utcnow_cached():
             return True, cooldown_until
         
         return False, None
     
     def clear_cooldown(self, ticker: str, strategy: str) -> bool:
         """Manually clear cooldown."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        affected = self._write(lambda conn: conn.execute("""
             UPDATE signals
             SET cooldown_until = NULL
             WHERE ticker = ? AND strategy = ?
-        """, (ticker, strategy))
-        
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        """, (ticker, strategy)).rowcount)
+        self._invalidate_cache()
         
         if affected:
             logger.info(f"Cleared cooldown for {ticker}/{strategy}")
         return affected > 0
     
-    def get_active_cooldowns(self) -> List[Dict]:
-        """Get all active cooldowns."""
+    def get_active_cooldowns(self) -> List[sqlite3.Row]:
+        """Get all active cooldowns as rows keyed ticker / strategy / cooldown_until."""
         conn = self._get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
+        return conn.execute("""
             SELECT ticker, strategy, cooldown_until
             FROM signals
             WHERE cooldown_until > datetime('now')
             ORDER BY cooldown_until
-        """)
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        return [
-            {
-                'ticker': r[0],
-                'strategy': r[1],
-                'cooldown_until': r[2]
-            }
-            for r in rows
-        ]
\ No newline at end of file
+        """).fetchall()
\ No newline at end of file
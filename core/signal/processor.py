@@ -5,15 +5,24 @@ Manages signal lifecycle: KIV → CONFIRMED → EXECUTED.
 
 import sqlite3
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 import uuid
 
 from core.utils.registry import ComponentRegistry
+from core.utils.clock import now_iso_cached
+from core.utils.sqlite_pool import get_reader, run_write
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _hour_bucket(epoch_hour: int) -> str:
+    """Format an epoch hour as YYYYMMDDHH (UTC), cached for the current hour."""
+    return datetime.fromtimestamp(epoch_hour * 3600, timezone.utc).strftime("%Y%m%d%H")
+
 class SignalProcessor:
     """
     Processes trading signals through their lifecycle.
@@ -29,20 +38,51 @@ class SignalProcessor:
         self.db_path = Path(db_path)
         
         # Get dependencies from registry
-        registry = ComponentRegistry()
-        self.confidence = registry.get('signal', 'confidence')()
-        self.cooldown = registry.get('signal', 'cooldown')()
+        registry = ComponentRegistry.get_default()
+        self.confidence = registry.instance('signal', 'confidence')
+        self.cooldown = registry.instance('signal', 'cooldown')
         
         # Timeouts
         self.kiv_timeout_hours = 4
         self.confirmed_timeout_hours = 2
+        
+        self._ensure_schema()
     
     def _get_connection(self):
-        return sqlite3.connect(str(self.db_path))
+        """Read-only connection; writes go through _write."""
+        return get_reader(self.db_path)
+    
+    def _write(self, fn):
+        """Run fn(conn) in one transaction on the database's writer thread."""
+        return run_write(self.db_path, fn)
+    
+    def _ensure_schema(self):
+        """Add trigger_epoch and lookup indexes to databases built before they existed."""
+        def migrate(conn):
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(signals)")}
+            if 'trigger_epoch' not in columns:
+                conn.execute("ALTER TABLE signals ADD COLUMN trigger_epoch INTEGER")
+                conn.execute("""
+                    UPDATE signals
+                    SET trigger_epoch = CAST(strftime('%s', trigger_time) AS INTEGER)
+                    WHERE trigger_epoch IS NULL
+                """)
+                logger.info("Added trigger_epoch to signals and backfilled it")
+            
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_tsc ON signals(ticker, strategy, status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_status_conf ON signals(status, confidence_score DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_status_epoch ON signals(status, trigger_epoch)")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_signals_cooldown
+                ON signals(cooldown_until)
+                WHERE cooldown_until IS NOT NULL
+            """)
+        
+        self._write(migrate)
     
     def _generate_signal_id(self, ticker: str, strategy: str) -> str:
         """Generate unique signal ID with hourly bucket."""
-        hour_bucket = datetime.utcnow().strftime("%Y%m%d%H")
+        hour_bucket = _hour_bucket(int(time.time()) // 3600)
         return f"{ticker}_{strategy}_{hour_bucket}"
     
     def add_to_kiv(self, ticker: str, strategy: str,
@@ -56,17 +96,7 @@ class SignalProcessor:
         """
         Add a new signal to KIV (Keep In View).
         """
-        # Check cooldown first
-        on_cooldown, cooldown_until = self.cooldown.is_on_cooldown(ticker, strategy)
-        if on_cooldown:
-            logger.info(f"{ticker}/{strategy} on cooldown until {cooldown_until}")
-            return {
-                'status': 'REJECTED',
-                'reason': 'COOLDOWN',
-                'cooldown_until': cooldown_until
-            }
-        
-        # Calculate confidence score
+        # Calculate confidence score (pure Python, no I/O)
         confidence_result = self.confidence.calculate(
             ticker, strategy, signal_data, market_data
         )
@@ -75,38 +105,55 @@ class SignalProcessor:
         # Generate signal ID
         signal_id = self._generate_signal_id(ticker, strategy)
         
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        # Check if signal already exists (prevent duplicates)
-        cursor.execute("""
-            SELECT status FROM signals
-            WHERE signal_id = ? OR (ticker = ? AND strategy = ? AND status IN ('KIV', 'CONFIRMED'))
-        """, (signal_id, ticker, strategy))
+        def insert(conn):
+            # Cooldown and duplicate state in one statement
+            cooldown_until, existing_status = conn.execute("""
+                SELECT
+                    (SELECT cooldown_until FROM signals
+                     WHERE ticker = :ticker AND strategy = :strategy
+                       AND cooldown_until > datetime('now')
+                     ORDER BY cooldown_until DESC
+                     LIMIT 1) AS cd_until,
+                    (SELECT status FROM signals
+                     WHERE signal_id = :signal_id
+                        OR (ticker = :ticker AND strategy = :strategy
+                            AND status IN ('KIV', 'CONFIRMED'))
+                     LIMIT 1) AS existing_status
+            """, {'ticker': ticker, 'strategy': strategy, 'signal_id': signal_id}).fetchone()
+            if cooldown_until or existing_status:
+                return cooldown_until, existing_status
+            
+            # Insert new signal
+            conn.execute("""
+                INSERT INTO signals
+                (signal_id, ticker, strategy, trigger_time, trigger_epoch,
+                 trigger_price, rebound_bottom, go_in_price, profit_target,
+                 stop_loss, confidence_score, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (signal_id, ticker, strategy, now_iso_cached(), int(time.time()),
+                  trigger_price, rebound_bottom, go_in_price,
+                  profit_target, stop_loss, confidence, 'KIV'))
+            return None, None
+        
+        # Checks and insert share one write transaction
+        cooldown_until, existing_status = self._write(insert)
+        
+        if cooldown_until:
+            cooldown_until = datetime.fromisoformat(cooldown_until)
+            logger.info(f"{ticker}/{strategy} on cooldown until {cooldown_until}")
+            return {
+                'status': 'REJECTED',
+                'reason': 'COOLDOWN',
+                'cooldown_until': cooldown_until
+            }
         
-        existing = cursor.fetchone()
-        if existing:
-            conn.close()
-            logger.debug(f"Signal already exists for {ticker}/{strategy}: {existing[0]}")
+        if existing_status:
+            logger.debug(f"Signal already exists for {ticker}/{strategy}: {existing_status}")
             return {
                 'status': 'EXISTS',
-                'signal_status': existing[0]
+                'signal_status': existing_status
             }
         
-        # Insert new signal
-        cursor.execute("""
-            INSERT INTO signals
-            (signal_id, ticker, strategy, trigger_time, trigger_price,
-             rebound_bottom, go_in_price, profit_target, stop_loss,
-             confidence_score, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (signal_id, ticker, strategy, datetime.utcnow(),
-              trigger_price, rebound_bottom, go_in_price,
-              profit_target, stop_loss, confidence, 'KIV'))
-        
-        conn.commit()
-        conn.close()
-        
         logger.info(f"Added {ticker}/{strategy} to KIV (confidence: {confidence})")
         
         return {
@@ -121,129 +168,107 @@ class SignalProcessor:
         """
         Check if a KIV signal is confirmed (price bounced from rebound_bottom).
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        # Find active KIV signal
-        cursor.execute("""
-            SELECT signal_id, trigger_time, rebound_bottom, go_in_price,
-                   profit_target, stop_loss, confidence_score
-            FROM signals
-            WHERE ticker = ? AND strategy = ? AND status = 'KIV'
-            ORDER BY trigger_time DESC
-            LIMIT 1
-        """, (ticker, strategy))
-        
-        row = cursor.fetchone()
+        now = int(time.time())
+        params = {
+            'ticker': ticker,
+            'strategy': strategy,
+            'price': current_price,
+            'expire_cutoff': now - self.kiv_timeout_hours * 3600
+        }
         
-        if not row:
-            conn.close()
+        # Resolve the latest KIV signal in one statement: expire it, confirm it
+        # (price bounced 1% above rebound_bottom) or leave it as KIV
+        rows = self._write(lambda conn: conn.execute("""
+            UPDATE signals SET status = CASE
+                WHEN trigger_epoch < :expire_cutoff THEN 'EXPIRED'
+                WHEN rebound_bottom > 0 AND :price >= rebound_bottom * 1.01 THEN 'CONFIRMED'
+                ELSE status
+            END
+            WHERE signal_id = (
+                SELECT signal_id FROM signals
+                WHERE ticker = :ticker AND strategy = :strategy AND status = 'KIV'
+                ORDER BY trigger_epoch DESC
+                LIMIT 1
+            )
+            RETURNING signal_id, status, trigger_epoch, go_in_price,
+                      profit_target, stop_loss, confidence_score
+        """, params).fetchall())
+        
+        if not rows:
             return {'confirmed': False, 'reason': 'NO_KIV_SIGNAL'}
         
-        (signal_id, trigger_time, rebound_bottom, go_in_price,
-         profit_target, stop_loss, confidence) = row
+        (signal_id, status, trigger_epoch, go_in_price,
+         profit_target, stop_loss, confidence) = rows[0]
         
-        # Check if signal expired
-        trigger_dt = datetime.fromisoformat(trigger_time) if isinstance(trigger_time, str) else trigger_time
-        age_hours = (datetime.utcnow() - trigger_dt).total_seconds() / 3600
-        
-        if age_hours > self.kiv_timeout_hours:
-            # Mark as expired
-            cursor.execute("""
-                UPDATE signals SET status = 'EXPIRED'
-                WHERE signal_id = ?
-            """, (signal_id,))
-            conn.commit()
-            conn.close()
+        if status == 'EXPIRED':
+            age_hours = (now - trigger_epoch) / 3600
             logger.info(f"KIV signal {signal_id} expired (age: {age_hours:.1f}h)")
             return {'confirmed': False, 'reason': 'EXPIRED'}
         
-        # Check for confirmation (price bounced 1% above rebound_bottom)
-        if rebound_bottom and rebound_bottom > 0:
-            bounce_threshold = rebound_bottom * 1.01  # 1% bounce
-            if current_price >= bounce_threshold:
-                # Confirmed! Move to CONFIRMED
-                cursor.execute("""
-                    UPDATE signals SET status = 'CONFIRMED'
-                    WHERE signal_id = ?
-                """, (signal_id,))
-                conn.commit()
-                conn.close()
-                
-                logger.info(f"Signal {signal_id} CONFIRMED at ${current_price}")
-                return {
-                    'confirmed': True,
-                    'signal_id': signal_id,
-                    'go_in_price': go_in_price,
-                    'profit_target': profit_target,
-                    'stop_loss': stop_loss,
-                    'confidence': confidence
-                }
+        if status == 'CONFIRMED':
+            logger.info(f"Signal {signal_id} CONFIRMED at ${current_price}")
+            return {
+                'confirmed': True,
+                'signal_id': signal_id,
+                'go_in_price': go_in_price,
+                'profit_target': profit_target,
+                'stop_loss': stop_loss,
+                'confidence': confidence
+            }
         
-        conn.close()
         return {'confirmed': False, 'reason': 'NOT_CONFIRMED'}
     
-    def get_confirmed_signals(self, min_confidence: int = 60) -> List[Dict]:
+    def get_confirmed_signals(self, min_confidence: int = 60,
+                              limit: Optional[int] = None) -> Iterator[sqlite3.Row]:
         """
-        Get all CONFIRMED signals ready for execution.
-        """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        Get CONFIRMED signals ready for execution, best first.
         
+        Stale signals are expired immediately; the remaining rows are
+        streamed lazily. Pass limit to have SQLite return only the top
+        rows (it can then stop at the first `limit` of the index scan).
+        Rows are read by key (row['ticker'], row['confidence']); use
+        dict(row) where a plain dict is needed.
+        """
         # Check for expired confirmed signals
-        cutoff = datetime.utcnow() - timedelta(hours=self.confirmed_timeout_hours)
+        cutoff = int(time.time()) - self.confirmed_timeout_hours * 3600
         
         # Expire old confirmed signals
-        cursor.execute("""
+        expired = self._write(lambda conn: conn.execute("""
             UPDATE signals SET status = 'EXPIRED'
-            WHERE status = 'CONFIRMED' AND trigger_time < ?
-        """, (cutoff,))
+            WHERE status = 'CONFIRMED' AND trigger_epoch < ?
+        """, (cutoff,)).rowcount)
         
-        expired = cursor.rowcount
         if expired:
             logger.info(f"Expired {expired} old CONFIRMED signals")
         
         # Get active confirmed signals with sufficient confidence
-        cursor.execute("""
+        cursor = self._get_connection().execute("""
             SELECT signal_id, ticker, strategy, go_in_price,
-                   profit_target, stop_loss, confidence_score
+                   profit_target, stop_loss, confidence_score AS confidence
             FROM signals
             WHERE status = 'CONFIRMED' AND confidence_score >= ?
             ORDER BY confidence_score DESC
-        """, (min_confidence,))
+            LIMIT ?
+        """, (min_confidence, -1 if limit is None else limit))
         
-        rows = cursor.fetchall()
-        conn.close()
-        
-        signals = []
-        for row in rows:
-            signals.append({
-                'signal_id': row[0],
-                'ticker': row[1],
-                'strategy': row[2],
-                'go_in_price': row[3],
-                'profit_target': row[4],
-                'stop_loss': row[5],
-                'confidence': row[6]
-            })
-        
-        return signals
+        return self._stream_signals(cursor)
+    
+    @staticmethod
+    def _stream_signals(cursor: sqlite3.Cursor) -> Iterator[sqlite3.Row]:
+        """Yield rows as the cursor steps; closes it when done or abandoned."""
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
     
     def mark_executed(self, signal_id: str, ticket_id: str) -> bool:
         """
         Mark a signal as executed.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        affected = self._write(lambda conn: conn.execute("""
             UPDATE signals SET status = 'EXECUTED'
             WHERE signal_id = ?
-        """, (signal_id,))
-        
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        """, (signal_id,)).rowcount)
         
         if affected:
             logger.info(f"Signal {signal_id} marked EXECUTED (ticket: {ticket_id})")
@@ -253,17 +278,10 @@ class SignalProcessor:
         """
         Reject a signal (e.g., risk manager declined).
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        affected = self._write(lambda conn: conn.execute("""
             UPDATE signals SET status = 'REJECTED'
             WHERE signal_id = ?
-        """, (signal_id,))
-        
-        affected = cursor.rowcount
-        conn.commit()
-        conn.close()
+        """, (signal_id,)).rowcount)
         
         if affected:
             logger.info(f"Signal {signal_id} REJECTED: {reason}")
@@ -284,7 +302,6 @@ class SignalProcessor:
         """, (signal_id,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return {
@@ -302,29 +319,34 @@ class SignalProcessor:
         """
         Clean up expired signals.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        now = datetime.utcnow()
-        kiv_cutoff = now - timedelta(hours=self.kiv_timeout_hours)
-        conf_cutoff = now - timedelta(hours=self.confirmed_timeout_hours)
+        now = int(time.time())
+        params = {
+            'kiv_cutoff': now - self.kiv_timeout_hours * 3600,
+            'conf_cutoff': now - self.confirmed_timeout_hours * 3600
+        }
+        stale = """
+            (status = 'KIV' AND trigger_epoch < :kiv_cutoff)
+            OR (status = 'CONFIRMED' AND trigger_epoch < :conf_cutoff)
+        """
         
-        # Expire old KIV
-        cursor.execute("""
-            UPDATE signals SET status = 'EXPIRED'
-            WHERE status = 'KIV' AND trigger_time < ?
-        """, (kiv_cutoff,))
-        expired_kiv = cursor.rowcount
+        def expire(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            counts = dict(conn.execute(f"""
+                SELECT status, COUNT(*) FROM signals
+                WHERE {stale}
+                GROUP BY status
+            """, params).fetchall())
+            conn.execute(f"""
+                UPDATE signals SET status = 'EXPIRED'
+                WHERE {stale}
+            """, params)
+            return counts
         
-        # Expire old CONFIRMED
-        cursor.execute("""
-            UPDATE signals SET status = 'EXPIRED'
-            WHERE status = 'CONFIRMED' AND trigger_time < ?
-        """, (conf_cutoff,))
-        expired_conf = cursor.rowcount
+        # Count per bucket, then expire both in one write transaction
+        counts = self._write(expire)
         
-        conn.commit()
-        conn.close()
+        expired_kiv = counts.get('KIV', 0)
+        expired_conf = counts.get('CONFIRMED', 0)
         
         return {
             'expired_kiv': expired_kiv,
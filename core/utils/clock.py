@@ -0,0 +1,30 @@
+"""
+Cheap wall-clock helpers for Mark 3.1.
+Hot paths that only need "now" to within a few milliseconds share one
+cached UTC timestamp instead of calling datetime.utcnow() each time.
+"""
+
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+# (monotonic_ns when taken, naive UTC datetime, SQLite-style string)
+_snapshot: Optional[Tuple[int, datetime, str]] = None
+
+def _current(ttl_ms: int) -> Tuple[int, datetime, str]:
+    global _snapshot
+    snap = _snapshot
+    now_ns = time.monotonic_ns()
+    if snap is None or now_ns - snap[0] >= ttl_ms * 1_000_000:
+        dt = datetime.utcnow()
+        # Same text the sqlite3 datetime adapter stores, so comparisons match
+        snap = _snapshot = (now_ns, dt, dt.isoformat(' '))
+    return snap
+
+def utcnow_cached(ttl_ms: int = 50) -> datetime:
+    """Naive UTC now, reused for up to ttl_ms milliseconds."""
+    return _current(ttl_ms)[1]
+
+def now_iso_cached(ttl_ms: int = 50) -> str:
+    """utcnow_cached() pre-formatted for binding into SQL."""
+    return _current(ttl_ms)[2]
@@ -7,10 +7,56 @@ import os
 import sys
 import time
 import errno
+import random
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolve the platform lock primitives once at import time
+if sys.platform == 'win32':
+    import ctypes
+    import msvcrt
+    
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _STILL_ACTIVE = 259
+    
+    def _pid_alive(pid):
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # Access denied still means the process exists
+            return ctypes.GetLastError() == 5
+        try:
+            code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(code)):
+                return True
+            return code.value == _STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    
+    def _lock_fn(fp):
+        msvcrt.locking(fp.fileno(), msvcrt.LK_NBLCK, 1)
+    
+    def _unlock_fn(fp):
+        msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+    
+    def _lock_fn(fp):
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    
+    def _unlock_fn(fp):
+        fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+    
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
 class CrossPlatformLock:
     """
     File-based lock with stale detection.
@@ -33,86 +79,114 @@ class CrossPlatformLock:
         self.pid = os.getpid()
     
     def acquire(self, timeout=30):
-        """Acquire lock with timeout in seconds."""
-        start_time = time.time()
+        """Acquire lock with timeout in seconds (0 makes a single attempt)."""
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        retry_stale = False
         
-        while time.time() - start_time < timeout:
+        # Always try at least once, so timeout=0 is a non-blocking check
+        while attempt == 0 or retry_stale or time.monotonic() < deadline:
+            attempt += 1
+            retry_stale = False
+            # 'a+' so a failed attempt doesn't truncate the holder's PID
+            fp = open(self.lock_path, 'a+')
             try:
-                if sys.platform == 'win32':
-                    # Windows: use open with exclusive flags
-                    self.fp = open(self.lock_path, 'w')
-                    # Windows doesn't have fcntl, but we can use msvcrt
-                    import msvcrt
-                    msvcrt.locking(self.fp.fileno(), msvcrt.LK_NBLCK, 1)
-                else:
-                    # Unix: use fcntl
-                    import fcntl
-                    self.fp = open(self.lock_path, 'w')
-                    fcntl.flock(self.fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                
-                # Write PID to lock file for stale detection
-                self.fp.write(str(self.pid))
-                self.fp.flush()
-                logger.debug(f"Lock acquired by PID {self.pid}")
-                return True
+                fp.seek(0)
+                _lock_fn(fp)
+            except OSError as e:
+                fp.close()
                 
-            except (IOError, OSError, ImportError) as e:
                 # Lock is held by another process
-                if hasattr(e, 'errno') and e.errno in (errno.EAGAIN, errno.EACCES):
-                    if self._is_stale():
-                        logger.warning("Stale lock detected, removing")
-                        self._remove_stale_lock()
-                        continue
+                if e.errno in (errno.EAGAIN, errno.EACCES) and self._is_stale():
+                    logger.warning("Stale lock detected, removing")
+                    self._remove_stale_lock()
+                    # One immediate retry on the fresh file, even past the deadline
+                    retry_stale = attempt == 1 or time.monotonic() < deadline
+                    continue
                 
                 logger.debug(f"Lock acquisition failed: {e}")
-                time.sleep(1)
                 
-        logger.error(f"Timeout after {timeout}s waiting for lock")
+                # Exponential backoff (10ms doubling, capped at 0.5s) plus jitter
+                delay = min(0.5, 0.01 * (2 ** (attempt - 1))) + random.uniform(0, 0.01)
+                time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+                continue
+            
+            # Write PID to lock file for stale detection
+            self.fp = fp
+            fp.seek(0)
+            fp.truncate()
+            fp.write(str(self.pid))
+            fp.flush()
+            logger.debug(f"Lock acquired by PID {self.pid}")
+            return True
+        
+        if timeout:
+            logger.error(f"Timeout after {timeout}s waiting for lock")
         return False
     
     def _is_stale(self):
-        """Check if lock file is older than stale_minutes."""
+        """
+        Check if a held lock belongs to a dead process.
+        
+        A held flock/msvcrt lock normally means its holder is alive, so age
+        alone is not enough: the file must also be older than stale_minutes
+        and name a PID that no longer exists.
+        """
         try:
-            if not os.path.exists(self.lock_path):
-                return False
-            
-            # Check file age
-            mtime = os.path.getmtime(self.lock_path)
-            age_minutes = (time.time() - mtime) / 60
-            
-            if age_minutes > self.stale_minutes:
-                # Try to read PID from stale lock
-                try:
-                    with open(self.lock_path, 'r') as f:
-                        pid = f.read().strip()
-                    logger.warning(f"Stale lock from PID {pid}, age {age_minutes:.1f}m")
-                except:
-                    pass
-                return True
-            
+            # One open + fstat instead of exists/getmtime/open (no TOCTOU gap)
+            fd = os.open(self.lock_path, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                pid_bytes = os.read(fd, 64)
+            finally:
+                os.close(fd)
+        except FileNotFoundError:
             return False
-        except Exception as e:
-            logger.error(f"Error checking stale lock: {e}")
+        except OSError as e:
+            # e.g. the holder's byte-range lock on Windows; assume it is alive
+            logger.debug(f"Could not read lock file: {e}")
             return False
+        
+        # Check file age
+        age_minutes = (time.time() - st.st_mtime) / 60
+        if age_minutes <= self.stale_minutes:
+            return False
+        
+        try:
+            pid = int(pid_bytes.decode(errors='replace').strip())
+        except ValueError:
+            return False
+        
+        if pid == self.pid or _pid_alive(pid):
+            logger.warning(f"Lock from PID {pid} is {age_minutes:.1f}m old but still held")
+            return False
+        
+        logger.warning(f"Stale lock from dead PID {pid}, age {age_minutes:.1f}m")
+        return True
     
     def _remove_stale_lock(self):
         """Remove stale lock file."""
         try:
-            os.remove(self.lock_path)
+            os.unlink(self.lock_path)
             logger.info("Removed stale lock file")
-        except Exception as e:
+        except FileNotFoundError:
+            pass
+        except OSError as e:
             logger.error(f"Failed to remove stale lock: {e}")
     
+    def touch(self):
+        """Refresh the lock file's mtime so a long-running holder is not seen as stale."""
+        if self.fp:
+            try:
+                os.utime(self.lock_path)
+            except OSError as e:
+                logger.error(f"Failed to refresh lock: {e}")
+    
     def release(self):
         """Release the lock."""
         if self.fp:
             try:
-                if sys.platform == 'win32':
-                    import msvcrt
-                    msvcrt.locking(self.fp.fileno(), msvcrt.LK_UNLCK, 1)
-                else:
-                    import fcntl
-                    fcntl.flock(self.fp.fileno(), fcntl.LOCK_UN)
+                _unlock_fn(self.fp)
                 
                 self.fp.close()
                 self.fp = None
@@ -120,7 +194,7 @@ class CrossPlatformLock:
                 # Remove lock file
                 if os.path.exists(self.lock_path):
                     os.remove(self.lock_path)
-                    
+                
                 logger.debug("Lock released")
             except Exception as e:
                 logger.error(f"Error releasing lock: {e}")
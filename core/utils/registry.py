@@ -3,11 +3,13 @@ Dynamic component registry for Mark 3.1.
 Maps logical names to file paths and handles dynamic imports.
 """
 
+import os
 import json
 import importlib.util
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -16,22 +18,58 @@ class ComponentRegistry:
     Central registry for all dynamic components.
     
     Usage:
-        registry = ComponentRegistry()
+        registry = ComponentRegistry.get_default()
         MomentumStrategy = registry.get('strategies', 'momentum')
         strategy = MomentumStrategy(config)
+        
+        # Shared, no-argument components (one instance per registry)
+        fetcher = registry.instance('data', 'fetcher')
+    
+    Entries in registry.json are {"path": ..., "class": ...} for classes,
+    or a bare path string for plain modules (get() returns the module).
+    scripts/migrate_registry.py fills in missing class names.
+    
+    Components should share one instance per registry file via
+    get_default(), so registry.json is parsed and each module imported
+    only once per process.
     """
     
-    def __init__(self, registry_path: str = 'registry.json'):
-        self.registry_path = Path(__file__).parent.parent.parent / registry_path
-        self._components: Dict[str, Any] = {}
-        self._mapping: Dict[str, Dict[str, str]] = {}
+    _defaults: Dict[str, 'ComponentRegistry'] = {}
+    _defaults_lock = threading.Lock()
+    
+    @classmethod
+    def get_default(cls, registry_path: str = 'registry.json') -> 'ComponentRegistry':
+        """Return the process-wide registry for registry_path, creating it on first use."""
+        registry = cls._defaults.get(registry_path)
+        if registry is None:
+            with cls._defaults_lock:
+                registry = cls._defaults.get(registry_path)
+                if registry is None:
+                    registry = cls._defaults[registry_path] = cls(registry_path)
+        return registry
+    
+    def __init__(self, registry_path: str = 'registry.json',
+                 reload_if_changed: bool = False):
+        self._base_dir = Path(__file__).resolve().parent.parent.parent
+        self.registry_path = self._base_dir / registry_path
+        self.reload_if_changed = reload_if_changed
+        self._mtime: Optional[float] = None
+        self._components: Dict[Tuple[str, str], Any] = {}
+        self._mapping: Dict[str, Dict[str, Union[str, Dict[str, str]]]] = {}
+        self._abs_paths: Dict[Tuple[str, str], Path] = {}
+        self._class_names: Dict[Tuple[str, str], Optional[str]] = {}
+        self._instances: Dict[Tuple[str, str], Any] = {}
+        # Reentrant: constructors resolve their own dependencies via instance()
+        self._instances_lock = threading.RLock()
         self._load_registry()
     
     def _load_registry(self) -> None:
         """Load registry mapping from JSON file."""
         try:
             with open(self.registry_path, 'r') as f:
+                self._mtime = os.fstat(f.fileno()).st_mtime
                 self._mapping = json.load(f)
+            self._index_mapping()
             logger.info(f"Loaded registry with {sum(len(v) for v in self._mapping.values())} components")
         except FileNotFoundError:
             logger.error(f"Registry file not found: {self.registry_path}")
@@ -40,6 +78,20 @@ class ComponentRegistry:
             logger.error(f"Invalid registry JSON: {e}")
             raise
     
+    def _index_mapping(self) -> None:
+        """Pre-resolve absolute paths and class names for every entry."""
+        self._abs_paths = {}
+        self._class_names = {}
+        for component_type, entries in self._mapping.items():
+            for name, entry in entries.items():
+                if isinstance(entry, dict):
+                    rel_path, class_name = entry['path'], entry.get('class')
+                else:
+                    rel_path, class_name = entry, None
+                key = (component_type, name)
+                self._abs_paths[key] = self._base_dir / rel_path
+                self._class_names[key] = class_name
+    
     def get(self, component_type: str, name: str) -> Any:
         """
         Get a component class by type and name.
@@ -49,23 +101,24 @@ class ComponentRegistry:
             name: e.g., 'momentum', 'fetcher', 'manager'
         
         Returns:
-            The imported module or class
+            The registered class, or the module for path-only entries
         """
-        cache_key = f"{component_type}:{name}"
+        # Only stat registry.json when hot-reloading was asked for
+        if self.reload_if_changed and self.registry_path.stat().st_mtime != self._mtime:
+            self.reload()
+        
+        cache_key = (component_type, name)
         
         # Return cached if exists
-        if cache_key in self._components:
-            return self._components[cache_key]
+        class_obj = self._components.get(cache_key)
+        if class_obj is not None:
+            return class_obj
         
-        # Look up path
-        try:
-            rel_path = self._mapping[component_type][name]
-        except KeyError:
+        # Look up path (and explicit class name, if registered)
+        full_path = self._abs_paths.get(cache_key)
+        if full_path is None:
             raise ImportError(f"Component {component_type}/{name} not found in registry")
-        
-        # Convert to absolute path
-        base_dir = Path(__file__).parent.parent.parent
-        full_path = base_dir / rel_path
+        class_name = self._class_names[cache_key]
         
         if not full_path.exists():
             raise ImportError(f"File not found: {full_path}")
@@ -78,38 +131,65 @@ class ComponentRegistry:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
         
-        # Find the class (assumes class name matches or is same as name)
-        # Convert 'momentum' to 'Momentum' or 'MomentumStrategy'
-        class_candidates = [
-            name.title(),                    # Momentum
-            name.title() + 'Strategy',       # MomentumStrategy
-            name.upper(),                    # MOMENTUM
-        ]
-        
-        class_obj = None
-        for candidate in class_candidates:
-            if hasattr(module, candidate):
-                class_obj = getattr(module, candidate)
-                break
-        
-        # Fallback: look for any class ending with 'Strategy'
-        if class_obj is None:
-            for attr_name in dir(module):
-                if attr_name.endswith('Strategy'):
-                    class_obj = getattr(module, attr_name)
-                    break
-        
-        if class_obj is None:
-            raise ImportError(f"No class found in {full_path}")
+        if class_name:
+            class_obj = getattr(module, class_name, None)
+            if class_obj is None:
+                raise ImportError(f"Class {class_name} not found in {full_path}")
+        else:
+            class_obj = module
         
         # Cache and return
         self._components[cache_key] = class_obj
-        logger.debug(f"Loaded {component_type}/{name} from {rel_path}")
+        logger.debug(f"Loaded {component_type}/{name} from {full_path}")
         return class_obj
     
+    def instance(self, component_type: str, name: str) -> Any:
+        """
+        Get the shared instance of a component, constructing it on first use.
+        
+        The class must take no required constructor arguments; use get()
+        and construct it yourself when arguments are needed.
+        """
+        cache_key = (component_type, name)
+        obj = self._instances.get(cache_key)
+        if obj is None:
+            with self._instances_lock:
+                obj = self._instances.get(cache_key)
+                if obj is None:
+                    obj = self._instances[cache_key] = self.get(component_type, name)()
+                    logger.debug(f"Created shared {component_type}/{name}")
+        return obj
+    
+    def warm(self, component_types: Optional[Iterable[str]] = None) -> int:
+        """
+        Eagerly import and cache components so later lookups are hits.
+        
+        Args:
+            component_types: Types to preload (default: all registered)
+        
+        Returns:
+            Number of components loaded
+        """
+        if component_types is None:
+            component_types = list(self._mapping.keys())
+        
+        loaded = 0
+        for component_type in component_types:
+            for name in self._mapping.get(component_type, {}):
+                try:
+                    self.get(component_type, name)
+                    loaded += 1
+                except ImportError as e:
+                    logger.warning(f"Could not preload {component_type}/{name}: {e}")
+        
+        logger.info(f"Registry warmed: {loaded} components loaded")
+        return loaded
+    
     def reload(self) -> None:
         """Force reload registry and clear cache."""
         self._components.clear()
+        with self._instances_lock:
+            self._instances.clear()
         self._load_registry()
         logger.info("Registry reloaded")
     
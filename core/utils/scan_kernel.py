@@ -0,0 +1,141 @@
+"""
+Unusual-activity scoring kernel for the Tier 2 watch list scan.
+Uses the ahead-of-time build (scripts/compile_scan_kernel.py) if present,
+else JIT-compiles with Numba when it is installed; otherwise an
+equivalent NumPy implementation is used.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Bits in out_flags
+FLAG_VOLUME = 1
+FLAG_BREAKOUT = 2
+FLAG_MOMENTUM = 4
+FLAG_REL_VOLUME = 8
+
+# Columns in out_metrics
+M_VOLUME_RATIO = 0
+M_BREAKOUT_PCT = 1
+M_PRICE_CHANGE = 2
+M_REL_VOLUME = 3
+M_AVG_VOLUME = 4
+N_METRICS = 5
+
+def _score_batch_numpy(volumes, highs, lows, closes, out_scores, out_flags,
+                       out_metrics, vol_thr, br_thr, mom_thr):
+    """
+    Score a batch of symbols in place (NumPy fallback for the Numba kernel).
+    
+    Args:
+        volumes, highs, lows, closes: float64 arrays of shape (n, bars)
+        out_scores: float64 (n,) total activity score per symbol
+        out_flags: int64 (n,) FLAG_* bits for the rules that fired
+        out_metrics: float64 (n, N_METRICS) values behind each rule
+        vol_thr, br_thr, mom_thr: volume-spike, breakout and momentum thresholds
+    """
+    current_volume, prev_volume = volumes[:, -1], volumes[:, -2]
+    current_price, prev_close = closes[:, -1], closes[:, -2]
+    
+    avg_volume = volumes.mean(axis=1)
+    volume_ratio = np.divide(current_volume, avg_volume,
+                             out=np.ones_like(avg_volume), where=avg_volume > 0)
+    
+    recent_high = highs.max(axis=1)
+    price_range = recent_high - lows.min(axis=1)
+    breakout_pct = np.divide(current_price - recent_high, recent_high,
+                             out=np.zeros_like(recent_high), where=recent_high != 0)
+    price_change = np.divide(current_price - prev_close, prev_close,
+                             out=np.zeros_like(prev_close), where=prev_close != 0)
+    rel_volume = np.divide(current_volume, prev_volume,
+                           out=np.ones_like(prev_volume), where=prev_volume > 0)
+    
+    volume_hit = volume_ratio > vol_thr
+    breakout_hit = (price_range > 0) & (breakout_pct > br_thr)
+    momentum_hit = np.abs(price_change) > mom_thr
+    rel_volume_hit = rel_volume > 2.0
+    
+    out_scores[:] = (np.where(volume_hit, np.minimum(50.0, volume_ratio * 20.0), 0.0)
+                     + np.where(breakout_hit, 30.0, 0.0)
+                     + np.where(momentum_hit, 20.0, 0.0)
+                     + np.where(rel_volume_hit, 10.0, 0.0))
+    out_flags[:] = (volume_hit * FLAG_VOLUME + breakout_hit * FLAG_BREAKOUT
+                    + momentum_hit * FLAG_MOMENTUM + rel_volume_hit * FLAG_REL_VOLUME)
+    
+    out_metrics[:, M_VOLUME_RATIO] = volume_ratio
+    out_metrics[:, M_BREAKOUT_PCT] = breakout_pct
+    out_metrics[:, M_PRICE_CHANGE] = price_change
+    out_metrics[:, M_REL_VOLUME] = rel_volume
+    out_metrics[:, M_AVG_VOLUME] = avg_volume
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _score_batch_numba(volumes, highs, lows, closes, out_scores, out_flags,
+                           out_metrics, vol_thr, br_thr, mom_thr):
+        """Compiled kernel; same contract as _score_batch_numpy, parallel over symbols."""
+        n, width = volumes.shape
+        for i in prange(n):
+            total = 0.0
+            high = highs[i, 0]
+            low = lows[i, 0]
+            for j in range(width):
+                total += volumes[i, j]
+                if highs[i, j] > high:
+                    high = highs[i, j]
+                if lows[i, j] < low:
+                    low = lows[i, j]
+            
+            avg_volume = total / width
+            current_volume = volumes[i, width - 1]
+            prev_volume = volumes[i, width - 2]
+            current_price = closes[i, width - 1]
+            prev_close = closes[i, width - 2]
+            
+            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+            breakout_pct = (current_price - high) / high if high != 0 else 0.0
+            price_change = (current_price - prev_close) / prev_close if prev_close != 0 else 0.0
+            rel_volume = current_volume / prev_volume if prev_volume > 0 else 1.0
+            
+            score = 0.0
+            flags = 0
+            if volume_ratio > vol_thr:
+                score += min(50.0, volume_ratio * 20.0)
+                flags |= FLAG_VOLUME
+            if high - low > 0 and breakout_pct > br_thr:
+                score += 30.0
+                flags |= FLAG_BREAKOUT
+            if abs(price_change) > mom_thr:
+                score += 20.0
+                flags |= FLAG_MOMENTUM
+            if rel_volume > 2.0:
+                score += 10.0
+                flags |= FLAG_REL_VOLUME
+            
+            out_scores[i] = score
+            out_flags[i] = flags
+            out_metrics[i, M_VOLUME_RATIO] = volume_ratio
+            out_metrics[i, M_BREAKOUT_PCT] = breakout_pct
+            out_metrics[i, M_PRICE_CHANGE] = price_change
+            out_metrics[i, M_REL_VOLUME] = rel_volume
+            out_metrics[i, M_AVG_VOLUME] = avg_volume
+    
+    score_batch = _score_batch_numba
+else:
+    logger.debug("numba not installed, using NumPy scan kernel")
+    score_batch = _score_batch_numpy
+
+# Precompiled extension skips the multi-second JIT compile on a cold start
+try:
+    from core.utils.scan_kernel_aot import score_batch
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
@@ -0,0 +1,183 @@
+"""
+SQLite connection pool for Mark 3.1.
+Keeps one long-lived, pre-configured connection per database per thread,
+read-only connections for WAL readers, and a single writer thread per
+database that serialises all writes.
+"""
+
+import sqlite3
+import threading
+import queue
+import logging
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Per-connection tuning (journal_mode is set separately, it persists in the file)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_local = threading.local()
+
+_writers: Dict[str, "_Writer"] = {}
+_writers_lock = threading.Lock()
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open and configure a new connection."""
+    conn = sqlite3.connect(db_path)
+    if db_path != ':memory:':
+        conn.execute("PRAGMA journal_mode=WAL")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _thread_connections(kind: str = 'connections') -> Dict[str, sqlite3.Connection]:
+    conns = getattr(_local, kind, None)
+    if conns is None:
+        conns = {}
+        setattr(_local, kind, conns)
+    return conns
+
+class _Writer:
+    """Dedicated thread owning the only write connection to one database."""
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._queue: queue.Queue = queue.Queue()
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        
+        self._thread = threading.Thread(
+            target=self._run, name=f"sqlite-writer-{Path(db_path).name}", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+    
+    def _run(self):
+        try:
+            conn = _connect(self.db_path)
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                # One transaction per work item
+                with conn:
+                    result = fn(conn)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        
+        conn.close()
+    
+    def submit(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        future: Future = Future()
+        self._queue.put((fn, future))
+        return future
+    
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+
+def _get_writer(key: str) -> _Writer:
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _Writer(key)
+            logger.debug(f"Started writer thread for {key}")
+        return writer
+
+def get_pooled(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """
+    Get this thread's pooled connection for a database.
+    
+    The connection stays open between calls. Callers commit (or use
+    `with conn:`) but must not close it.
+    """
+    key = str(db_path)
+    conns = _thread_connections()
+    
+    conn = conns.get(key)
+    if conn is None:
+        conn = _connect(key)
+        conns[key] = conn
+        logger.debug(f"Opened pooled connection to {key}")
+    return conn
+
+def get_reader(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """
+    Get this thread's read-only connection for a database.
+    
+    WAL lets these read concurrently with the writer thread. Writes
+    must go through submit_write / run_write instead. Rows come back as
+    sqlite3.Row, so they support both positional and by-name access.
+    """
+    key = str(db_path)
+    conns = _thread_connections('readers')
+    
+    conn = conns.get(key)
+    if conn is None:
+        # The writer switches the file to WAL before any reader attaches
+        _get_writer(key)
+        conn = sqlite3.connect(f"file:{Path(key).resolve().as_posix()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conns[key] = conn
+        logger.debug(f"Opened read-only connection to {key}")
+    return conn
+
+def submit_write(db_path: Union[str, Path],
+                 fn: Callable[[sqlite3.Connection], Any]) -> Future:
+    """
+    Queue fn(conn) on the database's writer thread.
+    
+    fn runs inside its own transaction (committed on return, rolled back
+    if it raises). It must not submit further writes itself.
+    """
+    return _get_writer(str(db_path)).submit(fn)
+
+def run_write(db_path: Union[str, Path],
+              fn: Callable[[sqlite3.Connection], Any]) -> Any:
+    """Run fn(conn) on the writer thread and wait for its result."""
+    return submit_write(db_path, fn).result()
+
+def close_pooled(db_path: Optional[Union[str, Path]] = None) -> None:
+    """Close this thread's pooled and read-only connection(s), e.g. on shutdown."""
+    for kind in ('connections', 'readers'):
+        conns = _thread_connections(kind)
+        keys = [str(db_path)] if db_path is not None else list(conns)
+        
+        for key in keys:
+            conn = conns.pop(key, None)
+            if conn is not None:
+                conn.close()
+                logger.debug(f"Closed pooled connection to {key}")
+
+def stop_writers() -> None:
+    """Drain and stop all writer threads, e.g. on shutdown."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    
+    for writer in writers:
+        writer.stop()
@@ -3,16 +3,17 @@ Time utilities for Mark 3.1.
 Handles timezone conversions, market hours, DST.
 """
 
-import pytz
-from datetime import datetime, time, date, timedelta
+from datetime import datetime, time, date, timedelta, timezone
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, List
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
 # Timezone definitions
-NY_TZ = pytz.timezone('America/New_York')
-UTC_TZ = pytz.UTC
+NY_TZ = ZoneInfo('America/New_York')
+UTC_TZ = timezone.utc
 
 # Default calendar for 2026 (will be updated annually)
 DEFAULT_CALENDAR_2026 = {
@@ -45,13 +46,48 @@ def utc_to_ny(dt_utc: datetime) -> datetime:
 def ny_to_utc(dt_ny: datetime) -> datetime:
     """Convert New York time to UTC."""
     if dt_ny.tzinfo is None:
-        dt_ny = NY_TZ.localize(dt_ny)
+        dt_ny = dt_ny.replace(tzinfo=NY_TZ)
     return dt_ny.astimezone(UTC_TZ)
 
 def get_utc_midnight() -> datetime:
     """Get UTC midnight for today (start of day)."""
     return now_utc().replace(hour=0, minute=0, second=0, microsecond=0)
 
+_NO_DATES: frozenset = frozenset()
+
+@lru_cache(maxsize=32)
+def _date_set(dates: Tuple[date, ...]) -> frozenset:
+    return frozenset(dates)
+
+def _calendar_dates(calendar: Optional[Dict], key: str) -> frozenset:
+    """Calendar date list as a frozenset, cached on its contents (the calendar is not modified)."""
+    if not calendar:
+        return _NO_DATES
+    return _date_set(tuple(calendar.get(key, ())))
+
+@lru_cache(maxsize=512)
+def _ny_date_for_utc_hour(hour_utc: datetime) -> date:
+    """New York date for a UTC hour (NY offsets are whole hours, so it is fixed within the hour)."""
+    return utc_to_ny(hour_utc).date()
+
+def _ny_date(dt_utc: datetime) -> date:
+    if dt_utc.tzinfo is not UTC_TZ:
+        dt_utc = dt_utc.astimezone(UTC_TZ)
+    return _ny_date_for_utc_hour(dt_utc.replace(minute=0, second=0, microsecond=0))
+
+@lru_cache(maxsize=512)
+def _ny_offset_for_date(date_ny: date) -> timedelta:
+    """NY UTC offset for a date (DST switches at 02:00, so noon holds for the whole session)."""
+    return NY_TZ.utcoffset(datetime.combine(date_ny, time(12, 0)))
+
+@lru_cache(maxsize=512)
+def _bounds_for_ny_date(date_ny: date, is_early_close: bool) -> Tuple[datetime, datetime]:
+    """(open_utc, close_utc) for a trading day; early closes end at 13:00 ET."""
+    offset = _ny_offset_for_date(date_ny)
+    open_ny = datetime.combine(date_ny, time(9, 30))
+    close_ny = datetime.combine(date_ny, time(13, 0) if is_early_close else time(16, 0))
+    return (open_ny - offset).replace(tzinfo=UTC_TZ), (close_ny - offset).replace(tzinfo=UTC_TZ)
+
 def is_market_hours(
     dt_utc: Optional[datetime] = None,
     calendar: Optional[Dict] = None
@@ -69,36 +105,27 @@ def is_market_hours(
     if dt_utc is None:
         dt_utc = now_utc()
     
-    dt_ny = utc_to_ny(dt_utc)
+    date_ny = _ny_date(dt_utc)
     
     # Layer 1: Weekend check
-    if dt_ny.weekday() >= 5:  # Saturday=5, Sunday=6
-        logger.debug(f"Weekend: {dt_ny.date()}, market closed")
+    if date_ny.weekday() >= 5:  # Saturday=5, Sunday=6
+        logger.debug(f"Weekend: {date_ny}, market closed")
         return False
     
     # Layer 2: Calendar check (if available)
-    if calendar:
-        date_ny = dt_ny.date()
-        
-        # Check holidays
-        if date_ny in calendar.get('holiday_dates', []):
-            logger.debug(f"Holiday: {date_ny}, market closed")
-            return False
-        
-        # Check early closes
-        if date_ny in calendar.get('early_close_dates', []):
-            # Early close at 1:00 PM ET
-            early_close = dt_ny.replace(hour=13, minute=0, second=0)
-            is_open = dt_ny <= early_close
-            logger.debug(f"Early close day: {date_ny}, open until 13:00 ET")
-            return is_open
+    if date_ny in _calendar_dates(calendar, 'holiday_dates'):
+        logger.debug(f"Holiday: {date_ny}, market closed")
+        return False
+    
+    is_early_close = date_ny in _calendar_dates(calendar, 'early_close_dates')
+    if is_early_close:
+        logger.debug(f"Early close day: {date_ny}, open until 13:00 ET")
     
-    # Layer 3: Regular hours
-    market_open = dt_ny.replace(hour=9, minute=30, second=0)
-    market_close = dt_ny.replace(hour=16, minute=0, second=0)
+    # Layer 3: Regular (or early-close) hours, from the per-day cache
+    market_open, market_close = _bounds_for_ny_date(date_ny, is_early_close)
     
-    is_open = market_open <= dt_ny <= market_close
-    logger.debug(f"Regular hours: {is_open} at {dt_ny.time()}")
+    is_open = market_open <= dt_utc <= market_close
+    logger.debug(f"Market hours: {is_open} at {dt_utc.time()} UTC")
     return is_open
 
 def get_market_hours_bounds(
@@ -114,27 +141,14 @@ def get_market_hours_bounds(
     if dt_utc is None:
         dt_utc = now_utc()
     
-    dt_ny = utc_to_ny(dt_utc)
-    date_ny = dt_ny.date()
+    date_ny = _ny_date(dt_utc)
     
     # Check if full holiday
-    if calendar and date_ny in calendar.get('holiday_dates', []):
+    if date_ny in _calendar_dates(calendar, 'holiday_dates'):
         return None, None
     
-    # Check if early close
-    if calendar and date_ny in calendar.get('early_close_dates', []):
-        open_ny = datetime.combine(date_ny, time(9, 30))
-        close_ny = datetime.combine(date_ny, time(13, 0))
-    else:
-        # Regular day
-        open_ny = datetime.combine(date_ny, time(9, 30))
-        close_ny = datetime.combine(date_ny, time(16, 0))
-    
-    # Convert to UTC
-    open_utc = ny_to_utc(open_ny)
-    close_utc = ny_to_utc(close_ny)
-    
-    return open_utc, close_utc
+    is_early_close = date_ny in _calendar_dates(calendar, 'early_close_dates')
+    return _bounds_for_ny_date(date_ny, is_early_close)
 
 def minutes_until_market_close(
     dt_utc: Optional[datetime] = None,
@@ -162,4 +176,4 @@ def parse_sheets_time(time_str: str) -> datetime:
     # Remove ' UTC' if present
     clean_str = time_str.replace(' UTC', '')
     dt = datetime.strptime(clean_str, "%Y-%m-%d %H:%M:%S")
-    return UTC_TZ.localize(dt)
\ No newline at end of file
+    return dt.replace(tzinfo=UTC_TZ)
\ No newline at end of file
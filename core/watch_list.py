@@ -7,7 +7,9 @@ import sqlite3
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from core.utils.sqlite_pool import get_pooled, close_pooled
 
 logger = logging.getLogger(__name__)
 
@@ -26,70 +28,96 @@ class WatchListManager:
                 first_spotted DATETIME,
                 last_active DATETIME,
                 spike_count INTEGER DEFAULT 1,
-                avg_score REAL,
+                sum_score REAL,
                 sector TEXT,
                 status TEXT DEFAULT 'WATCHING'
             )
         """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_watch_list_last_active ON watch_list(last_active)")
+        
+        # Older tables stored a running avg_score; keep the total instead
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(watch_list)")}
+        if 'sum_score' not in columns:
+            cursor.execute("ALTER TABLE watch_list ADD COLUMN sum_score REAL")
+            cursor.execute("UPDATE watch_list SET sum_score = avg_score * spike_count")
+            logger.info("Migrated watch_list.avg_score to sum_score")
+        
+        # Covering index: the active-list query is answered from the index alone
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_watch_active_sum
+            ON watch_list(last_active, ticker, spike_count, sum_score, sector, first_spotted)
+        """)
+        # Superseded by the covering index above (same leading column)
+        cursor.execute("DROP INDEX IF EXISTS idx_watch_list_last_active")
+        cursor.execute("DROP INDEX IF EXISTS idx_watch_active_score")
         conn.commit()
-        conn.close()
     
     def _get_connection(self):
-        return sqlite3.connect(str(self.db_path))
+        # Long-lived per-thread connection, already in WAL with tuned PRAGMAs
+        return get_pooled(self.db_path)
     
-    def add_or_update(self, ticker: str, score: float, sector: str = 'Other'):
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def close(self):
+        """Close this thread's connection, e.g. at the end of a build."""
+        close_pooled(self.db_path)
+    
+    # Pure increments; the average is sum_score / spike_count on read
+    _UPSERT_SQL = """
+        INSERT INTO watch_list (ticker, first_spotted, last_active, spike_count, sum_score, sector)
+        VALUES (?, ?, ?, 1, ?, ?)
+        ON CONFLICT(ticker) DO UPDATE SET
+            last_active = excluded.last_active,
+            spike_count = spike_count + 1,
+            sum_score = sum_score + excluded.sum_score
+    """
+    
+    def add_or_update(self, ticker: str, score: float, sector: str = 'Other') -> Tuple[int, float]:
+        """Upsert one symbol; returns its (spike_count, avg_score) after the update."""
         now = datetime.utcnow()
+        conn = self._get_connection()
+        with conn:
+            spike_count, avg_score = conn.execute(
+                self._UPSERT_SQL + " RETURNING spike_count, sum_score / spike_count",
+                (ticker, now, now, score, sector)
+            ).fetchone()
         
-        cursor.execute("SELECT first_spotted, spike_count, avg_score FROM watch_list WHERE ticker = ?", (ticker,))
-        existing = cursor.fetchone()
+        if spike_count > 1:
+            logger.debug(f"{ticker} spike #{spike_count}, avg score {avg_score:.1f}")
+        return spike_count, avg_score
+    
+    def add_or_update_batch(self, rows: List[Tuple[str, float, str]]) -> int:
+        """Upsert many (ticker, score, sector) rows in one transaction."""
+        if not rows:
+            return 0
         
-        if existing:
-            first_spotted, spike_count, old_avg = existing
-            new_count = spike_count + 1
-            new_avg = (old_avg * spike_count + score) / new_count
-            cursor.execute("UPDATE watch_list SET last_active = ?, spike_count = ?, avg_score = ? WHERE ticker = ?",
-                          (now, new_count, new_avg, ticker))
-        else:
-            cursor.execute("INSERT INTO watch_list (ticker, first_spotted, last_active, spike_count, avg_score, sector) VALUES (?, ?, ?, ?, ?, ?)",
-                          (ticker, now, now, 1, score, sector))
+        now = datetime.utcnow()
+        params = [(ticker, now, now, score, sector) for ticker, score, sector in rows]
         
-        conn.commit()
-        conn.close()
-    
-    def get_active_watch_list(self, max_age_hours: int = 72) -> List[Dict]:
         conn = self._get_connection()
-        cursor = conn.cursor()
+        with conn:
+            conn.executemany(self._UPSERT_SQL, params)
+        return len(params)
+    
+    def get_active_watch_list(self, max_age_hours: int = 72, limit: Optional[int] = None,
+                              offset: int = 0) -> List[sqlite3.Row]:
+        """Active symbols by avg_score, highest first; rows support row['ticker'] access."""
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = sqlite3.Row
         cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-        cursor.execute("SELECT ticker, first_spotted, last_active, spike_count, avg_score, sector FROM watch_list WHERE last_active > ? ORDER BY avg_score DESC", (cutoff,))
-        rows = cursor.fetchall()
-        conn.close()
-        
-        watch_list = []
-        for row in rows:
-            watch_list.append({
-                'ticker': row[0],
-                'first_spotted': row[1],
-                'last_active': row[2],
-                'spike_count': row[3],
-                'avg_score': row[4],
-                'sector': row[5]
-            })
-        return watch_list
+        cursor.execute("""
+            SELECT ticker, first_spotted, last_active, spike_count,
+                   sum_score / spike_count AS avg_score, sector
+            FROM watch_list
+            WHERE last_active > ?
+            ORDER BY avg_score DESC
+            LIMIT ? OFFSET ?
+        """, (cutoff, -1 if limit is None else limit, offset))
+        return cursor.fetchall()
     
     def prune_old_entries(self, max_age_days: int = 30):
         conn = self._get_connection()
-        cursor = conn.cursor()
         cutoff = datetime.utcnow() - timedelta(days=max_age_days)
-        cursor.execute("DELETE FROM watch_list WHERE last_active < ?", (cutoff,))
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with conn:
+            deleted = conn.execute("DELETE FROM watch_list WHERE last_active < ?", (cutoff,)).rowcount
         return deleted
     
-    def get_top_candidates(self, limit: int = 50) -> List[Dict]:
-        watch_list = self.get_active_watch_list(max_age_hours=24)
-        watch_list.sort(key=lambda x: x['avg_score'], reverse=True)
-        return watch_list[:limit]
\ No newline at end of file
+    def get_top_candidates(self, limit: int = 50) -> List[sqlite3.Row]:
+        return self.get_active_watch_list(max_age_hours=24, limit=limit)
\ No newline at end of file
@@ -6,15 +6,22 @@ Updates UNIVERSE tab with today's ACTIVE symbols.
 Manages KIV signals and confirmations.
 """
 
+import hashlib
 import logging
+import os
 import sys
 import json
+import time
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+
 from core.data.fetcher import DataFetcher
 from core.utils.sheets import SheetsInterface
 from core.watch_list import WatchListManager
@@ -25,6 +32,18 @@ from config.settings import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+DATA_DIR = Path(__file__).parent.parent / "data"
+MASTER_DETAILS_CACHE = DATA_DIR / "master_details.json"
+MASTER_DETAILS_MAX_AGE_SECONDS = 7 * 24 * 3600  # master universe is rebuilt weekly
+UNIVERSE_DIGEST_PATH = DATA_DIR / ".universe_digest"
+
+def _write_json_atomic(path: Path, data: Any):
+    """Write compact JSON via a temp file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+    os.replace(tmp_path, path)
+
 class CandidateBuilder:
     
     def __init__(self):
@@ -38,7 +57,33 @@ class CandidateBuilder:
         self.min_price = 5
         self.max_price = 100
         
+        # Sheets lookups cached per builder (master details also on disk)
+        self._master_details: Optional[Dict[str, Dict]] = None
+        self._existing_universe: Optional[Dict[str, Dict]] = None
+        self._existing_universe_rows = 0
+        
     def load_master_universe_details(self) -> Dict[str, Dict]:
+        if self._master_details is None:
+            self._master_details = self._load_or_fetch_master_details()
+        return self._master_details
+    
+    def _load_or_fetch_master_details(self) -> Dict[str, Dict]:
+        """Use the on-disk copy while it is under a week old, else refetch from Sheets."""
+        try:
+            if time.time() - MASTER_DETAILS_CACHE.stat().st_mtime < MASTER_DETAILS_MAX_AGE_SECONDS:
+                with open(MASTER_DETAILS_CACHE, 'r') as f:
+                    return json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable master details cache: {e}")
+        
+        details = self._fetch_master_details()
+        if details:
+            _write_json_atomic(MASTER_DETAILS_CACHE, details)
+        return details
+    
+    def _fetch_master_details(self) -> Dict[str, Dict]:
         data = self.sheets.read_config("MASTER_UNIVERSE", "A:G")
         if not data or len(data) < 2:
             return {}
@@ -65,14 +110,14 @@ class CandidateBuilder:
         qualified = []
         master_details = self.load_master_universe_details()
         
+        ignored = self.ignore.snapshot()
+        candidates = [c for c in candidates if c['ticker'] not in ignored]
+        prices = self.fetcher.get_current_prices([c['ticker'] for c in candidates])
+        
         for candidate in candidates:
             ticker = candidate['ticker']
             
-            ignored, _ = self.ignore.is_ignored(ticker)
-            if ignored:
-                continue
-            
-            price_data = self.fetcher.get_current_price(ticker)
+            price_data = prices.get(ticker)
             if not price_data:
                 continue
             
@@ -92,16 +137,22 @@ class CandidateBuilder:
                 'first_spotted': candidate['first_spotted']
             })
         
-        qualified.sort(key=lambda x: x['score'], reverse=True)
-        top_candidates = qualified[:self.max_candidates]
+        top_candidates = nlargest(self.max_candidates, qualified, key=itemgetter('score'))
         logger.info(f"Selected {len(top_candidates)} candidates for today")
         return top_candidates
     
     def check_and_add_to_kiv(self, candidates: List[Dict]):
+        if not candidates:
+            return
+        
+        all_bars = self.fetcher.get_bars_batch([c['ticker'] for c in candidates],
+                                               period=30,
+                                               timeframe=TimeFrame(5, TimeFrameUnit.Minute))
+        
         for candidate in candidates:
             ticker = candidate['ticker']
             
-            bars = self.fetcher.get_bars(ticker, period=30, timeframe='5Min')
+            bars = all_bars.get(ticker)
             if bars is None or len(bars) < 20:
                 continue
             
@@ -175,18 +226,20 @@ class CandidateBuilder:
             'Last_Active', 'Active_Days', 'Last_Updated_UTC', 'Notes'
         ]]
         
+        watch_list = self.watch_manager.get_active_watch_list(max_age_hours=24, limit=100)
+        
+        # Skip the Sheets read/write entirely if the visible content is unchanged
+        digest = self._universe_digest(today_str, candidates, watch_list)
+        try:
+            if UNIVERSE_DIGEST_PATH.read_text() == digest:
+                logger.info("UNIVERSE tab unchanged, skipping update")
+                return
+        except OSError:
+            pass
+        
         rows = []
         candidate_tickers = {c['ticker'] for c in candidates}
-        
-        existing = self.sheets.read_config("UNIVERSE", "A:L")
-        existing_map = {}
-        if existing and len(existing) > 1:
-            for row in existing[1:]:
-                if len(row) >= 8:
-                    existing_map[row[0]] = {
-                        'added_date': row[7],
-                        'notes': row[11] if len(row) > 11 else ''
-                    }
+        existing_map = self._load_existing_universe()
         
         for candidate in candidates:
             ticker = candidate['ticker']
@@ -207,8 +260,7 @@ class CandidateBuilder:
                 f"Score: {candidate['score']:.1f}, Spikes: {candidate['spike_count']}"
             ])
         
-        watch_list = self.watch_manager.get_active_watch_list(max_age_hours=24)
-        for item in watch_list[:100]:
+        for item in watch_list:
             if item['ticker'] not in candidate_tickers:
                 added_date = existing_map.get(item['ticker'], {}).get('added_date', today_str)
                 rows.append([
@@ -226,9 +278,42 @@ class CandidateBuilder:
                     f"Score: {item['avg_score']:.1f}"
                 ])
         
-        self.sheets.clear_range("UNIVERSE", "A2:Z")
+        # Blank out leftover rows in the same write instead of a separate clear_range call
+        symbol_count = len(rows)
+        stale = self._existing_universe_rows - symbol_count
+        if stale > 0:
+            rows.extend([[''] * len(headers[0]) for _ in range(stale)])
         self.sheets.write_data("UNIVERSE", headers + rows, "A1")
-        logger.info(f"Updated UNIVERSE tab with {len(rows)} symbols")
+        UNIVERSE_DIGEST_PATH.write_text(digest)
+        logger.info(f"Updated UNIVERSE tab with {symbol_count} symbols")
+    
+    @staticmethod
+    def _universe_digest(today_str: str, candidates: List[Dict], watch_list) -> str:
+        """Hash of the UNIVERSE fields that change between cycles, as displayed."""
+        content = [today_str]
+        content.extend((c['ticker'], f"{c['price']:.2f}", f"{c['score']:.1f}", c['spike_count'])
+                       for c in candidates)
+        content.extend((w['ticker'], f"{w['avg_score']:.1f}") for w in watch_list)
+        encoded = json.dumps(content, separators=(',', ':')).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+    
+    def _load_existing_universe(self) -> Dict[str, Dict]:
+        """Current UNIVERSE tab rows by ticker, read once per build."""
+        if self._existing_universe is not None:
+            return self._existing_universe
+        
+        existing = self.sheets.read_config("UNIVERSE", "A:L")
+        self._existing_universe_rows = len(existing) - 1 if existing else 0
+        existing_map = {}
+        if existing and len(existing) > 1:
+            for row in existing[1:]:
+                if len(row) >= 8:
+                    existing_map[row[0]] = {
+                        'added_date': row[7],
+                        'notes': row[11] if len(row) > 11 else ''
+                    }
+        self._existing_universe = existing_map
+        return existing_map
     
     def save_universe_json(self, candidates: List[Dict]):
         symbols = [c['ticker'] for c in candidates]
@@ -238,20 +323,26 @@ class CandidateBuilder:
             'timestamp': datetime.utcnow().isoformat(),
             'source': 'watch_list_candidates'
         }
-        json_path = Path(__file__).parent.parent / "data" / "universe.json"
-        with open(json_path, 'w') as f:
-            json.dump(universe_data, f, indent=2)
+        _write_json_atomic(DATA_DIR / "universe.json", universe_data)
         logger.info(f"Saved {len(symbols)} candidates to universe.json")
     
     def build(self):
         logger.info("=" * 50)
         logger.info("Building Tier 3: Today's Candidates...")
         
+        # The UNIVERSE tab may have changed since the last build
+        self._existing_universe = None
+        
         candidates = self.select_candidates()
         self.check_and_add_to_kiv(candidates)
         self.check_kiv_confirmations()
-        self.update_universe_tab(candidates)
-        self.save_universe_json(candidates)
+        
+        # Quiet cycle: nothing to write, so skip the Sheets round trips
+        if not candidates and not self.watch_manager.get_active_watch_list(max_age_hours=24, limit=1):
+            logger.info("No candidates or active watch list, no changes")
+        else:
+            self.update_universe_tab(candidates)
+            self.save_universe_json(candidates)
         
         kiv_summary = self.kiv_manager.get_kiv_summary()
         logger.info(f"KIV Status: {kiv_summary}")
@@ -6,15 +6,22 @@ Runs daily to identify symbols with unusual activity from master universe.
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
+
 from core.data.fetcher import DataFetcher
 from core.utils.sheets import SheetsInterface
+from core.utils import scan_kernel
 from core.watch_list import WatchListManager
+from core.risk.ignore import IgnoreManager
 from config.settings import settings
 
 logging.basicConfig(level=logging.INFO)
@@ -26,11 +33,16 @@ class WatchListBuilder:
         self.fetcher = DataFetcher()
         self.sheets = SheetsInterface()
         self.watch_manager = WatchListManager()
+        self.ignore = IgnoreManager()
         
         self.volume_spike_threshold = 1.5
         self.breakout_threshold = 0.02
         self.momentum_threshold = 0.01
         
+        self.scan_batch_size = 200
+        self.sheet_rows = 200
+        self.fetch_workers = 8
+        
     def load_master_universe(self) -> List[str]:
         data = self.sheets.read_config("MASTER_UNIVERSE", "A:G")
         if not data or len(data) < 2:
@@ -44,78 +56,100 @@ class WatchListBuilder:
         logger.info(f"Loaded {len(symbols)} symbols from master universe")
         return symbols
     
-    def detect_unusual_activity(self, symbol: str) -> Dict[str, Any]:
+    def _fetch_recent_bars(self, symbol: str) -> Optional[np.ndarray]:
+        """Last 20 five-minute bars for a symbol (BAR_DTYPE records), or None if unavailable."""
         try:
-            bars = self.fetcher.get_bars(symbol, period=25, timeframe='5Min')
-            if bars is None or len(bars) < 20:
-                return None
-            
-            recent = bars.tail(20)
-            current = recent.iloc[-1]
-            prev = recent.iloc[-2]
-            
-            avg_volume = recent['volume'].mean()
-            volume_ratio = current['volume'] / avg_volume if avg_volume > 0 else 1
-            
-            recent_high = recent['high'].max()
-            recent_low = recent['low'].min()
-            price_range = recent_high - recent_low
-            current_price = current['close']
+            bars = self.fetcher.get_bars_ndarray(symbol, period=25,
+                                                 timeframe=TimeFrame(5, TimeFrameUnit.Minute))
+        except Exception as e:
+            logger.debug(f"Error scanning {symbol}: {e}")
+            return None
+        if bars is None or len(bars) < 20:
+            return None
+        return bars[-20:]
+    
+    def score_activity_batch(self, symbols: List[str],
+                             bars: List[np.ndarray]) -> List[Dict[str, Any]]:
+        """
+        Score unusual activity for many symbols at once.
+        
+        Each record array holds the same 20 recent bars per symbol; they are
+        stacked into (n_symbols, 20) arrays and scored in one call to the
+        scan kernel (Numba-compiled when available, NumPy otherwise).
+        """
+        if not symbols:
+            return []
+        
+        volumes = np.stack([b['volume'] for b in bars])
+        highs = np.stack([b['high'] for b in bars])
+        lows = np.stack([b['low'] for b in bars])
+        closes = np.stack([b['close'] for b in bars])
+        
+        n = len(symbols)
+        scores = np.zeros(n, dtype=np.float64)
+        flags = np.zeros(n, dtype=np.int64)
+        metrics = np.zeros((n, scan_kernel.N_METRICS), dtype=np.float64)
+        scan_kernel.score_batch(
+            volumes, highs, lows, closes, scores, flags, metrics,
+            self.volume_spike_threshold, self.breakout_threshold, self.momentum_threshold
+        )
+        
+        # Only build result dicts and signal labels for symbols that scored
+        results = []
+        for i in np.flatnonzero(scores > 0):
+            volume_ratio, breakout_pct, price_change, rel_volume, avg_volume = metrics[i]
             
-            score = 0
             signals = []
-            
-            if volume_ratio > self.volume_spike_threshold:
-                score += min(50, volume_ratio * 20)
+            if flags[i] & scan_kernel.FLAG_VOLUME:
                 signals.append(f"volume_{volume_ratio:.1f}x")
-            
-            if price_range > 0:
-                breakout_pct = (current_price - recent_high) / recent_high
-                if breakout_pct > self.breakout_threshold:
-                    score += 30
-                    signals.append(f"breakout_{breakout_pct:.1%}")
-            
-            price_change = (current_price - prev['close']) / prev['close']
-            if abs(price_change) > self.momentum_threshold:
-                score += 20
+            if flags[i] & scan_kernel.FLAG_BREAKOUT:
+                signals.append(f"breakout_{breakout_pct:.1%}")
+            if flags[i] & scan_kernel.FLAG_MOMENTUM:
                 signals.append(f"momentum_{price_change:.1%}")
-            
-            rel_volume = current['volume'] / prev['volume'] if prev['volume'] > 0 else 1
-            if rel_volume > 2:
-                score += 10
+            if flags[i] & scan_kernel.FLAG_REL_VOLUME:
                 signals.append(f"rel_vol_{rel_volume:.1f}x")
             
-            if score > 0:
-                return {
-                    'symbol': symbol,
-                    'score': score,
-                    'signals': signals,
-                    'volume_ratio': volume_ratio,
-                    'current_price': current_price,
-                    'avg_volume': avg_volume
-                }
-            return None
-        except Exception as e:
-            logger.debug(f"Error scanning {symbol}: {e}")
+            results.append({
+                'symbol': symbols[i],
+                'score': float(scores[i]),
+                'signals': signals,
+                'volume_ratio': float(volume_ratio),
+                'current_price': float(closes[i, -1]),
+                'avg_volume': float(avg_volume)
+            })
+        return results
+    
+    def detect_unusual_activity(self, symbol: str) -> Optional[Dict[str, Any]]:
+        recent = self._fetch_recent_bars(symbol)
+        if recent is None:
             return None
+        activity = self.score_activity_batch([symbol], [recent])
+        return activity[0] if activity else None
     
     def scan_master_universe(self, symbols: List[str]) -> List[Dict]:
         active_symbols = []
         total = len(symbols)
         logger.info(f"Scanning {total} symbols for unusual activity...")
         
-        for i, symbol in enumerate(symbols):
-            if i % 100 == 0:
-                logger.info(f"Progress: {i}/{total}")
-            
-            activity = self.detect_unusual_activity(symbol)
-            if activity:
-                active_symbols.append(activity)
-                self.watch_manager.add_or_update(
-                    symbol, 
-                    activity['score'],
-                    sector='Unknown'
-                )
+        # Bar fetches are network-bound: overlap them, then score each batch at once
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as pool:
+            for start in range(0, total, self.scan_batch_size):
+                logger.info(f"Progress: {start}/{total}")
+                batch = symbols[start:start + self.scan_batch_size]
+                
+                fetched = [
+                    (symbol, bars)
+                    for symbol, bars in zip(batch, pool.map(self._fetch_recent_bars, batch))
+                    if bars is not None
+                ]
+                if fetched:
+                    batch_symbols, batch_bars = zip(*fetched)
+                    active_symbols.extend(self.score_activity_batch(list(batch_symbols), list(batch_bars)))
+        
+        # One transaction for the whole scan instead of a commit per symbol
+        self.watch_manager.add_or_update_batch(
+            [(a['symbol'], a['score'], 'Unknown') for a in active_symbols]
+        )
         
         active_symbols.sort(key=lambda x: x['score'], reverse=True)
         logger.info(f"Found {len(active_symbols)} symbols with unusual activity")
@@ -127,21 +161,23 @@ class WatchListBuilder:
             'Spike_Count', 'Avg_Score', 'Status'
         ]]
         
-        watch_list = self.watch_manager.get_active_watch_list(max_age_hours=72)
+        watch_list = self.watch_manager.get_active_watch_list(max_age_hours=72, limit=self.sheet_rows)
         rows = []
-        for item in watch_list[:200]:
+        for item in watch_list:
             rows.append([
                 item['ticker'],
                 item['first_spotted'][:10] if item['first_spotted'] else '',
                 item['last_active'][:10] if item['last_active'] else '',
                 str(item['spike_count']),
                 f"{item['avg_score']:.1f}",
-                item.get('status', 'WATCHING')
+                'WATCHING'
             ])
         
-        self.sheets.clear_range("WATCH_LIST", "A2:Z")
+        # Always write the full sheet_rows block so older rows are blanked in the same call
+        symbol_count = len(rows)
+        rows.extend([[''] * len(headers[0]) for _ in range(self.sheet_rows - symbol_count)])
         self.sheets.write_data("WATCH_LIST", headers + rows, "A1")
-        logger.info(f"Updated WATCH_LIST tab with {len(rows)} symbols")
+        logger.info(f"Updated WATCH_LIST tab with {symbol_count} symbols")
     
     def build(self):
         logger.info("=" * 50)
@@ -155,6 +191,9 @@ class WatchListBuilder:
         active = self.scan_master_universe(symbols)
         self.update_watch_list_sheet(active)
         
+        self.ignore.cleanup_expired()
+        self.watch_manager.close()
+        
         logger.info(f"Watch list build complete: {len(active)} active symbols")
         logger.info("=" * 50)
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the watch list scan kernel for Mark 3.1.
+Builds core/utils/scan_kernel_aot (a C extension) with numba.pycc, so the
+daily build_watch_list run loads machine code instead of JIT-compiling.
+Requires numba at build time only; re-run after changing scan_kernel.py.
+
+Usage:
+    python scripts/compile_scan_kernel.py
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.utils import scan_kernel
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OUTPUT_DIR = Path(__file__).parent.parent / "core" / "utils"
+
+# Same argument types score_activity_batch passes to score_batch
+SIGNATURE = 'void(f8[:,:], f8[:,:], f8[:,:], f8[:,:], f8[:], i8[:], f8[:,:], f8, f8, f8)'
+
+def main():
+    if not scan_kernel.NUMBA_AVAILABLE:
+        logger.error("numba is not installed; cannot compile the scan kernel")
+        sys.exit(1)
+    
+    from numba.pycc import CC
+    
+    cc = CC('scan_kernel_aot')
+    cc.output_dir = str(OUTPUT_DIR)
+    cc.verbose = True
+    
+    # AOT builds are single-threaded, so prange compiles as a plain loop
+    cc.export('score_batch', SIGNATURE)(scan_kernel._score_batch_numba.py_func)
+    cc.compile()
+    logger.info(f"Compiled scan_kernel_aot into {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    main()
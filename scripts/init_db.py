@@ -16,22 +16,9 @@ logger = logging.getLogger(__name__)
 # Database path - using your Windows path
 DB_PATH = Path(__file__).parent.parent / "data" / "trade_log.db"
 
-def init_database():
-    """Create all tables if they don't exist."""
-    
-    # Ensure data directory exists
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    
-    conn = sqlite3.connect(str(DB_PATH))
-    cursor = conn.cursor()
-    
-    # Enable foreign keys
-    cursor.execute("PRAGMA foreign_keys = ON")
-    
-    # Create tables in order (dependencies first)
-    
-    # 1. IGNORE_LIST
-    cursor.execute("""
+# Full schema, tables in dependency order; applied in one executescript call
+SCHEMA_SQL = """
+    -- 1. IGNORE_LIST
     CREATE TABLE IF NOT EXISTS ignore_list (
         ticker TEXT PRIMARY KEY,
         reason_code TEXT,
@@ -43,16 +30,29 @@ def init_database():
         last_seen_issue TEXT,
         first_seen DATETIME DEFAULT CURRENT_TIMESTAMP,
         notes TEXT
-    )
-    """)
+    );
+    
+    -- 1b. IGNORE_HISTORY (archive of long-expired ignores, no hot indexes)
+    CREATE TABLE IF NOT EXISTS ignore_history (
+        ticker TEXT,
+        reason_code TEXT,
+        scope TEXT,
+        ttl_utc DATETIME,
+        auto_manual TEXT,
+        retry_count INTEGER DEFAULT 0,
+        backoff_level INTEGER DEFAULT 1,
+        last_seen_issue TEXT,
+        first_seen DATETIME,
+        notes TEXT
+    );
     
-    # 2. SIGNALS
-    cursor.execute("""
+    -- 2. SIGNALS
     CREATE TABLE IF NOT EXISTS signals (
         signal_id TEXT PRIMARY KEY,
         ticker TEXT,
         strategy TEXT,
         trigger_time DATETIME,
+        trigger_epoch INTEGER,
         trigger_price REAL,
         rebound_bottom REAL,
         go_in_price REAL,
@@ -61,11 +61,9 @@ def init_database():
         confidence_score REAL,
         status TEXT,
         cooldown_until DATETIME
-    )
-    """)
+    );
     
-    # 3. POSITIONS (with partial unique index)
-    cursor.execute("""
+    -- 3. POSITIONS (with partial unique index)
     CREATE TABLE IF NOT EXISTS positions (
         ticket_id TEXT PRIMARY KEY,
         ticker TEXT,
@@ -78,22 +76,19 @@ def init_database():
         exit_signal TEXT,
         exit_reason TEXT,
         exit_time DATETIME
-    )
-    """)
-    
-    # Partial unique index for active positions
-    cursor.execute("""
-    CREATE UNIQUE INDEX IF NOT EXISTS ux_positions_one_active 
-    ON positions(ticker) 
-    WHERE status IN ('OPEN', 'CLOSING')
-    """)
-    
-    # Regular indexes
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_status ON positions(status)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_ticker ON positions(ticker)")
-    
-    # 4. TRADE_HISTORY
-    cursor.execute("""
+    );
+    
+    -- Partial unique index for active positions
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_positions_one_active
+    ON positions(ticker)
+    WHERE status IN ('OPEN', 'CLOSING');
+    
+    -- Regular indexes
+    CREATE INDEX IF NOT EXISTS idx_positions_active_ticker ON positions(status, ticker);
+    DROP INDEX IF EXISTS idx_positions_status;  -- prefix of the index above
+    CREATE INDEX IF NOT EXISTS idx_positions_ticker ON positions(ticker);
+    
+    -- 4. TRADE_HISTORY
     CREATE TABLE IF NOT EXISTS trade_history (
         exit_time DATETIME,
         ticker TEXT,
@@ -108,11 +103,9 @@ def init_database():
         correct_action TEXT,
         lesson TEXT,
         ticket_id TEXT REFERENCES positions(ticket_id)
-    )
-    """)
+    );
     
-    # 5. HEALTH_STATE
-    cursor.execute("""
+    -- 5. HEALTH_STATE
     CREATE TABLE IF NOT EXISTS health_state (
         timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
         state TEXT,
@@ -120,21 +113,17 @@ def init_database():
         data_errors_today INTEGER,
         ignore_list_size INTEGER,
         reason TEXT
-    )
-    """)
+    );
     
-    # 6. API_BUDGET
-    cursor.execute("""
+    -- 6. API_BUDGET
     CREATE TABLE IF NOT EXISTS api_budget (
         cycle_start DATETIME,
         endpoint TEXT,
         calls INTEGER,
         budget_limit INTEGER
-    )
-    """)
+    );
     
-    # 7. DATA_QUALITY_LOG
-    cursor.execute("""
+    -- 7. DATA_QUALITY_LOG
     CREATE TABLE IF NOT EXISTS data_quality_log (
         timestamp DATETIME,
         ticker TEXT,
@@ -143,22 +132,18 @@ def init_database():
         bars_expected INTEGER,
         bars_actual INTEGER,
         action_taken TEXT
-    )
-    """)
+    );
     
-    # 8. ERROR_LOG
-    cursor.execute("""
+    -- 8. ERROR_LOG
     CREATE TABLE IF NOT EXISTS error_log (
         timestamp DATETIME,
         component TEXT,
         error TEXT,
         severity TEXT,
         resolved BOOLEAN DEFAULT 0
-    )
-    """)
+    );
     
-    # 9. PRICE_CACHE
-    cursor.execute("""
+    -- 9. PRICE_CACHE
     CREATE TABLE IF NOT EXISTS price_cache (
         ticker TEXT PRIMARY KEY,
         price REAL,
@@ -167,11 +152,9 @@ def init_database():
         ask REAL,
         timestamp DATETIME,
         source TEXT
-    )
-    """)
+    );
     
-    # 10. STRATEGY_STATS
-    cursor.execute("""
+    -- 10. STRATEGY_STATS
     CREATE TABLE IF NOT EXISTS strategy_stats (
         ticker TEXT,
         date DATE,
@@ -180,15 +163,45 @@ def init_database():
         proximity_score REAL,
         asset_type TEXT,
         PRIMARY KEY (ticker, date)
-    )
-    """)
+    );
+    
+    -- Create performance indexes
+    CREATE INDEX IF NOT EXISTS idx_price_cache_timestamp ON price_cache(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_strategy_stats_date ON strategy_stats(date);
+    CREATE INDEX IF NOT EXISTS idx_error_log_resolved ON error_log(resolved);
+    CREATE INDEX IF NOT EXISTS idx_trade_history_exit_time ON trade_history(exit_time DESC);
+    
+    -- Signal lookups: cooldown/KIV checks, confirmed polling, active cooldowns
+    CREATE INDEX IF NOT EXISTS idx_signals_tsc ON signals(ticker, strategy, status);
+    CREATE INDEX IF NOT EXISTS idx_signals_status_conf ON signals(status, confidence_score DESC);
+    CREATE INDEX IF NOT EXISTS idx_signals_status_epoch ON signals(status, trigger_epoch);
+    CREATE INDEX IF NOT EXISTS idx_signals_cooldown
+    ON signals(cooldown_until)
+    WHERE cooldown_until IS NOT NULL;
+"""
+
+def init_database():
+    """Create all tables if they don't exist."""
+    
+    # Ensure data directory exists
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    
+    conn = sqlite3.connect(str(DB_PATH))
+    cursor = conn.cursor()
+    
+    # page_size only takes effect on a new, empty file and must precede WAL
+    cursor.execute("PRAGMA page_size = 8192")
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute("PRAGMA synchronous = NORMAL")
+    
+    # Enable foreign keys
+    cursor.execute("PRAGMA foreign_keys = ON")
     
-    # Create performance indexes
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_price_cache_timestamp ON price_cache(timestamp)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_strategy_stats_date ON strategy_stats(date)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_error_log_resolved ON error_log(resolved)")
+    # Create all tables and indexes in a single transaction
+    conn.executescript(f"BEGIN;\n{SCHEMA_SQL}\nCOMMIT;")
     
-    conn.commit()
+    # Refresh planner statistics for the new indexes
+    cursor.execute("ANALYZE")
     
     # Verify tables
     cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
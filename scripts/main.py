@@ -2,13 +2,23 @@
 """
 Main orchestrator for Mark 3.1.
 Runs every 5 minutes during market hours.
+
+Usage:
+    python scripts/main.py            # one cycle (run_bot.ps1 / cron)
+    python scripts/main.py --daemon   # cycle every 5 minutes until the close or SIGTERM
 """
 
+import json
 import logging
+import signal
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -16,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.utils.lock import CrossPlatformLock
 from core.utils.time_utils import is_market_hours, minutes_until_market_close
 from core.utils.registry import ComponentRegistry
+from core.utils.sqlite_pool import stop_writers
 from config.settings import settings
 
 # Set up logging
@@ -25,15 +36,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+CYCLE_MINUTES = 5
+# How often the daemon refreshes the lock file's mtime between cycles
+LOCK_TOUCH_SECONDS = 60
+
+# Set by SIGTERM/SIGINT; the daemon loop exits after the current cycle
+_shutdown = threading.Event()
+
+# Today's candidates, written by scripts/build_candidates.py
+UNIVERSE_PATH = Path(__file__).parent.parent / "data" / "universe.json"
+
+# Fallback TIER 1 list until universe.json has been built
+TIER1_SYMBOLS = ('SPY', 'QQQ', 'AAPL', 'MSFT', 'GOOGL')
+# TODO: Load TIER 2 symbols from universe; for now, a small test list
+TIER2_SYMBOLS = ('NVDA', 'AMD', 'TSLA', 'META', 'NFLX')
+
+@lru_cache(maxsize=2)
+def _load_universe(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Symbols in a universe file; keyed on mtime so it is only re-parsed after a rewrite."""
+    with open(path, 'r') as f:
+        return tuple(json.load(f).get('symbols', ()))
+
+def load_tier1_symbols() -> Tuple[str, ...]:
+    """TIER 1 symbols from universe.json, or TIER1_SYMBOLS if it is missing or empty."""
+    try:
+        symbols = _load_universe(str(UNIVERSE_PATH), UNIVERSE_PATH.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return TIER1_SYMBOLS
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load {UNIVERSE_PATH.name}, using default TIER 1: {e}")
+        return TIER1_SYMBOLS
+    return symbols or TIER1_SYMBOLS
+
 class TradingBot:
     """
     Main trading bot orchestrator.
     Runs 5-minute cycles during market hours.
     """
     
+    # Components no cycle step uses directly; built on first attribute access
+    _LAZY_COMPONENTS = {
+        'cache': ('data', 'cache'),
+        'session': ('data', 'session'),
+        'limits': ('risk', 'limits'),
+        'sizer': ('risk', 'sizer'),
+        'cooldown': ('signal', 'cooldown'),
+        'confidence': ('signal', 'confidence'),
+        'slippage': ('execution', 'slippage'),
+        'regime': ('market', 'regime'),
+        'breadth': ('market', 'breadth'),
+    }
+    
     def __init__(self):
-        self.registry = ComponentRegistry()
-        self.lock = CrossPlatformLock()
+        self.registry = ComponentRegistry.get_default()
         
         # Initialize components
         self._init_components()
@@ -41,54 +96,62 @@ class TradingBot:
         logger.info("Trading bot initialized")
     
     def _init_components(self):
-        """Initialize all components."""
+        """Initialize the components every cycle needs (others load lazily)."""
         # Data
-        self.cache = self.registry.get('data', 'cache')()
-        self.session = self.registry.get('data', 'session')()
-        self.fetcher = self.registry.get('data', 'fetcher')()
-        self.validator = self.registry.get('data', 'validator')()
+        self.fetcher = self.registry.instance('data', 'fetcher')
+        self.fetcher.configure_session(pool_connections=16, pool_maxsize=16)
+        self.validator = self.registry.instance('data', 'validator')
         
         # Risk
-        self.ignore = self.registry.get('risk', 'ignore')()
-        self.limits = self.registry.get('risk', 'limits')()
-        self.sizer = self.registry.get('risk', 'sizer')()
-        self.risk_manager = self.registry.get('risk', 'manager')()
+        self.ignore = self.registry.instance('risk', 'ignore')
+        self.risk_manager = self.registry.instance('risk', 'manager')
         
         # Signal
-        self.cooldown = self.registry.get('signal', 'cooldown')()
-        self.confidence = self.registry.get('signal', 'confidence')()
-        self.processor = self.registry.get('signal', 'processor')()
+        self.processor = self.registry.instance('signal', 'processor')
         
         # Execution
-        self.slippage = self.registry.get('execution', 'slippage')()
-        self.executor = self.registry.get('execution', 'executor')()
-        self.monitor = self.registry.get('execution', 'monitor')()
-        self.reconciler = self.registry.get('execution', 'reconciler')()
+        self.executor = self.registry.instance('execution', 'executor')
+        self.monitor = self.registry.instance('execution', 'monitor')
+        self.reconciler = self.registry.instance('execution', 'reconciler')
         
         # Market
-        self.regime = self.registry.get('market', 'regime')()
-        self.breadth = self.registry.get('market', 'breadth')()
-        self.sentinel = self.registry.get('market', 'sentinel')()
+        self.sentinel = self.registry.instance('market', 'sentinel')
+        
+        # Lets the TIER 2 scan's network wait overlap the TIER 1 scan
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tier2-scan')
+        # Risk reviews for the (at most 3) entry candidates run side by side
+        self._review_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='entry-review')
+    
+    def __getattr__(self, name: str):
+        # Only called for attributes not set yet, i.e. lazy components on first use
+        spec = self._LAZY_COMPONENTS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        component = self.registry.instance(*spec)
+        setattr(self, name, component)
+        logger.debug(f"Lazily initialized {spec[0]}/{spec[1]}")
+        return component
     
     def run_cycle(self):
         """
         Execute one complete trading cycle.
         Follows priority pyramid from spec.
         """
-        cycle_start = datetime.utcnow()
+        cycle_start = time.perf_counter()
         logger.info("=" * 50)
-        logger.info(f"Starting cycle at {cycle_start}")
+        logger.info(f"Starting cycle at {datetime.utcnow()}")
+        
+        # Get health state (once per cycle; it queries the DB and the broker)
+        health = self.sentinel.check_health()
+        logger.info(f"Health state: {health['state']} - {health['reason']}")
         
         # Check if we should trade
-        should_trade, trade_reason = self.sentinel.should_trade()
+        should_trade, trade_reason = self.sentinel.should_trade(health)
         if not should_trade:
             logger.warning(f"Trading halted: {trade_reason}")
             return
         
-        # Get health state
-        health = self.sentinel.check_health()
-        logger.info(f"Health state: {health['state']} - {health['reason']}")
-        
         # PRIORITY 1: EXITS (always run)
         logger.info("PRIORITY 1: Checking exits")
         self._check_exits()
@@ -105,15 +168,19 @@ class TradingBot:
             logger.warning("System RED - stopping after exits/reconciliation")
             return
         
+        # PRIORITY 4: TIER 2 SCAN (if health allows), in the background
+        tier2_scan = None
+        if health['state'] == 'GREEN':
+            logger.info("PRIORITY 4: Scanning TIER 2 symbols")
+            tier2_scan = self._scan_pool.submit(self._scan_tier2)
+        
         # PRIORITY 3: TIER 1 SCAN (if budget allows)
         if health['state'] in ['GREEN', 'YELLOW']:
             logger.info("PRIORITY 3: Scanning TIER 1 symbols")
             self._scan_tier1()
         
-        # PRIORITY 4: TIER 2 SCAN (if health allows)
-        if health['state'] == 'GREEN':
-            logger.info("PRIORITY 4: Scanning TIER 2 symbols")
-            self._scan_tier2()
+        if tier2_scan is not None:
+            tier2_scan.result()
         
         # PRIORITY 5: NEW ENTRIES
         if health['state'] in ['GREEN', 'YELLOW']:
@@ -125,47 +192,45 @@ class TradingBot:
         if mins_to_close < 15:
             logger.info(f"Pre-close window: {mins_to_close:.1f} minutes")
         
-        cycle_end = datetime.utcnow()
-        duration = (cycle_end - cycle_start).total_seconds()
+        duration = time.perf_counter() - cycle_start
         logger.info(f"Cycle completed in {duration:.2f} seconds")
         logger.info("=" * 50)
     
     def _check_exits(self):
-        """Check all exit conditions."""
+        """Check all exit conditions (one positions query for all three)."""
+        exits = self.monitor.check_all_exits()
+        
         # Stop losses (real-time)
-        stop_losses = self.monitor.check_stop_losses()
-        for exit in stop_losses:
+        for exit in exits['stop_loss']:
             logger.info(f"Stop loss executed: {exit}")
         
         # Strategy exits (bar completion)
-        strategy_exits = self.monitor.check_strategy_exits()
-        for exit in strategy_exits:
+        for exit in exits['strategy']:
             logger.info(f"Strategy exit executed: {exit}")
         
         # Pre-close forced exits
-        forced = self.monitor.check_pre_close()
-        for exit in forced:
+        for exit in exits['forced']:
             logger.info(f"Force close executed: {exit}")
     
     def _scan_tier1(self):
         """Scan TIER 1 symbols (high priority)."""
-        # TODO: Load TIER 1 symbols from universe
-        # For now, use a small test list
-        tier1_symbols = ['SPY', 'QQQ', 'AAPL', 'MSFT', 'GOOGL']
+        # Check ignore list (one query for the whole tier)
+        tier1_symbols = load_tier1_symbols()
+        ignored = self.ignore.snapshot()
+        symbols = [s for s in tier1_symbols if s not in ignored]
+        if len(symbols) < len(tier1_symbols) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skipping ignored: %s", sorted(ignored.intersection(tier1_symbols)))
         
-        for symbol in tier1_symbols:
-            # Check ignore list
-            ignored, info = self.ignore.is_ignored(symbol)
-            if ignored:
-                logger.debug(f"Skipping {symbol}: {info}")
-                continue
-            
+        # One batched quote request instead of a round trip per symbol
+        prices = self.fetcher.get_current_prices(symbols)
+        
+        for symbol in symbols:
             # Stage A validation
-            price_data = self.fetcher.get_current_price(symbol)
+            price_data = prices.get(symbol)
             valid, reason, data = self.validator.stage_a_validate(symbol, price_data)
             
             if not valid:
-                logger.debug(f"{symbol} failed Stage A: {reason}")
+                logger.debug("%s failed Stage A: %s", symbol, reason)
                 # Add to ignore if persistent
                 if 'STALE' in reason or 'INVALID' in reason:
                     self.ignore.add(symbol, reason, scope='ALL')
@@ -176,54 +241,36 @@ class TradingBot:
     
     def _scan_tier2(self):
         """Scan TIER 2 symbols (lower priority)."""
-        # TODO: Load TIER 2 symbols from universe
-        # For now, use a small test list
-        tier2_symbols = ['NVDA', 'AMD', 'TSLA', 'META', 'NFLX']
-        
-        for symbol in tier2_symbols:
-            # Quick check only
-            price_data = self.fetcher.get_current_price(symbol)
-            if price_data:
-                logger.debug(f"TIER 2 update: {symbol} @ ${price_data['price']:.2f}")
+        # Quick check only
+        prices = self.fetcher.get_current_prices(list(TIER2_SYMBOLS))
+        for symbol, price_data in prices.items():
+            logger.debug("TIER 2 update: %s @ $%.2f", symbol, price_data['price'])
     
     def _process_entries(self, health_state: str):
         """Process new entries from CONFIRMED signals."""
-        # Get confirmed signals with min confidence
+        # Get the top N confirmed signals with min confidence, based on health state
         min_confidence = 60 if health_state == 'GREEN' else 70
-        signals = self.processor.get_confirmed_signals(min_confidence=min_confidence)
+        max_entries = 3 if health_state == 'GREEN' else 1
+        candidates = list(self.processor.get_confirmed_signals(
+            min_confidence=min_confidence, limit=max_entries
+        ))
         
-        if not signals:
+        if not candidates:
             logger.debug("No confirmed signals")
             return
         
-        logger.info(f"Found {len(signals)} confirmed signals")
+        logger.info(f"Taking top {len(candidates)} confirmed signals")
         
-        # Sort by confidence
-        signals.sort(key=lambda x: x['confidence'], reverse=True)
+        # Risk checks are independent DB reads, so review all candidates at once;
+        # entries are still placed one at a time, in confidence order
+        reviews = list(self._review_pool.map(self._review_signal, candidates))
         
-        # Take top N based on health state
-        max_entries = 3 if health_state == 'GREEN' else 1
-        candidates = signals[:max_entries]
-        
-        for signal in candidates:
-            # Check if we can trade this symbol
-            can_trade, reason = self.risk_manager.can_trade_symbol(
-                signal['ticker'], signal['strategy']
-            )
-            
+        for signal, (can_trade, reason, approval) in zip(candidates, reviews):
             if not can_trade:
                 logger.info(f"Rejecting {signal['ticker']}: {reason}")
                 self.processor.reject_signal(signal['signal_id'], reason)
                 continue
             
-            # Approve trade
-            approval = self.risk_manager.approve_trade(
-                ticker=signal['ticker'],
-                price=signal['go_in_price'],
-                confidence=signal['confidence'],
-                strategy=signal['strategy']
-            )
-            
             if approval['approved']:
                 # Execute entry
                 result = self.executor.execute_entry(
@@ -241,26 +288,87 @@ class TradingBot:
                     logger.warning(f"Entry failed for {signal['ticker']}: {result.get('error', 'Unknown')}")
             else:
                 logger.info(f"Trade not approved: {approval['reason']}")
+    
+    def _review_signal(self, signal) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """Risk review for one signal: (can_trade, reason, approval or None)."""
+        # Check if we can trade this symbol
+        can_trade, reason = self.risk_manager.can_trade_symbol(
+            signal['ticker'], signal['strategy']
+        )
+        if not can_trade:
+            return False, reason, None
+        
+        # Approve trade
+        approval = self.risk_manager.approve_trade(
+            ticker=signal['ticker'],
+            price=signal['go_in_price'],
+            confidence=signal['confidence'],
+            strategy=signal['strategy']
+        )
+        return True, reason, approval
+
+def seconds_to_next_cycle(minutes: int = CYCLE_MINUTES) -> float:
+    """Seconds until the next wall-clock multiple of `minutes` (:00, :05, ...)."""
+    period = minutes * 60
+    return period - (time.time() % period)
+
+def _request_shutdown(signum, frame):
+    logger.info(f"Received signal {signum}, stopping after the current cycle")
+    _shutdown.set()
+
+def run_daemon(bot: TradingBot, lock: CrossPlatformLock):
+    """Run cycles on 5-minute boundaries while the market is open."""
+    signal.signal(signal.SIGTERM, _request_shutdown)
+    signal.signal(signal.SIGINT, _request_shutdown)
+    
+    while not _shutdown.is_set() and is_market_hours():
+        # Keep the lock fresh so other launches don't treat it as stale
+        lock.touch()
+        try:
+            bot.run_cycle()
+        except Exception:
+            logger.exception("Cycle failed, retrying at the next boundary")
+        
+        # Refresh the lock while waiting too, not just once per cycle
+        deadline = time.monotonic() + seconds_to_next_cycle()
+        while not _shutdown.wait(max(0.0, min(LOCK_TOUCH_SECONDS, deadline - time.monotonic()))):
+            if time.monotonic() >= deadline:
+                break
+            lock.touch()
+    
+    logger.info("Daemon stopping")
 
 def main():
     """Main entry point."""
-    bot = TradingBot()
+    daemon = '--daemon' in sys.argv[1:]
     
     # Check market hours
     if not is_market_hours():
         logger.info("Outside market hours - exiting")
         return
     
-    # Acquire lock
-    if not bot.lock.acquire(timeout=30):
+    # Acquire lock before building components (a running daemon holds it)
+    lock = CrossPlatformLock()
+    if not daemon:
+        # Scheduled single-cycle launches defer to a running daemon immediately
+        if not lock.acquire(timeout=0):
+            logger.info("Another instance (e.g. the daemon) holds the lock - exiting")
+            return
+    elif not lock.acquire(timeout=30):
         logger.error("Could not acquire lock - another instance may be running")
         return
     
     try:
-        # Run one cycle
-        bot.run_cycle()
+        bot = TradingBot()
+        if daemon:
+            run_daemon(bot, lock)
+        else:
+            # Run one cycle
+            bot.run_cycle()
     finally:
-        bot.lock.release()
+        # Close writer connections (checkpoints the WAL) before giving up the lock
+        stop_writers()
+        lock.release()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
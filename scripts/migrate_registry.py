@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Add explicit class names to registry.json for Mark 3.1.
+Parses each path-only entry's source with ast (nothing is imported) and
+records the component class, so ComponentRegistry.get never has to guess.
+
+Usage:
+    python scripts/migrate_registry.py           # show proposed changes
+    python scripts/migrate_registry.py --write   # update registry.json
+"""
+
+import ast
+import sys
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).parent.parent
+REGISTRY_PATH = BASE_DIR / "registry.json"
+
+def top_level_classes(source_path: Path) -> List[str]:
+    """Names of classes defined at module level, in file order."""
+    tree = ast.parse(source_path.read_text(encoding='utf-8'), filename=str(source_path))
+    return [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+
+def pick_class(name: str, classes: List[str]) -> Optional[str]:
+    """Choose the component class using the names the old probing accepted."""
+    if len(classes) == 1:
+        return classes[0]
+    
+    # Same candidates the registry used to try at runtime
+    for candidate in (name.title(), name.title() + 'Strategy', name.upper()):
+        if candidate in classes:
+            return candidate
+    
+    strategies = [c for c in classes if c.endswith('Strategy')]
+    if len(strategies) == 1:
+        return strategies[0]
+    
+    return None
+
+def migrate(mapping: Dict[str, Dict]) -> int:
+    """Convert path-only entries in place; returns how many were converted."""
+    converted = 0
+    for component_type, entries in mapping.items():
+        for name, entry in entries.items():
+            if isinstance(entry, dict):
+                continue
+            
+            source_path = BASE_DIR / entry
+            if not source_path.exists():
+                logger.warning(f"{component_type}/{name}: {entry} not found, skipped")
+                continue
+            
+            classes = top_level_classes(source_path)
+            class_name = pick_class(name, classes)
+            if class_name is None:
+                if classes:
+                    logger.warning(f"{component_type}/{name}: ambiguous classes {classes}, skipped")
+                else:
+                    logger.info(f"{component_type}/{name}: no classes, kept as module entry")
+                continue
+            
+            entries[name] = {"path": entry, "class": class_name}
+            converted += 1
+            logger.info(f"{component_type}/{name}: {class_name}")
+    
+    return converted
+
+def format_registry(mapping: Dict[str, Dict]) -> str:
+    """Render in registry.json's layout: one component per line."""
+    sections = []
+    for component_type, entries in mapping.items():
+        lines = [f'        {json.dumps(name)}: {json.dumps(entry)}' for name, entry in entries.items()]
+        sections.append(f'    {json.dumps(component_type)}: {{\n' + ',\n'.join(lines) + '\n    }')
+    return '{\n' + ',\n'.join(sections) + '\n}'
+
+def main():
+    with open(REGISTRY_PATH, 'r') as f:
+        mapping = json.load(f)
+    
+    converted = migrate(mapping)
+    if not converted:
+        logger.info("Nothing to migrate")
+        return
+    
+    if '--write' in sys.argv[1:]:
+        REGISTRY_PATH.write_text(format_registry(mapping), encoding='utf-8')
+        logger.info(f"Updated {REGISTRY_PATH} ({converted} entries)")
+    else:
+        logger.info(f"{converted} entries would change; re-run with --write to apply")
+
+if __name__ == "__main__":
+    main()